@@ -1,9 +1,145 @@
 """Account management and business logic."""
 
 import random
-from typing import Optional, List
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, Iterator, Optional, List, Tuple, TypeVar
 from .database import Database
-from .currency import is_valid_currency
+from .models import Account, Transaction
+from .currency import VALID_CURRENCIES
+
+T = TypeVar("T")
+
+# (account_number, first_name, last_name, account_type, currency, balance)
+AccountSummary = Tuple[str, str, str, str, str, int]
+
+# (created_at to the second, upper-cased type, '+' or '-', amount, balance_after)
+TransactionSummary = Tuple[str, str, str, int, int]
+
+_ACCOUNT_TYPES = frozenset(("checking", "savings"))
+
+# Largest amount or balance in cents; SQLite stores anything bigger as REAL
+MAX_CENTS = 2**63 - 1
+
+# Account numbers are 6 digits
+_ACCOUNT_NUMBER_RANGE = range(100000, 1_000_000)
+_ACCOUNT_NUMBER_SPACE = len(_ACCOUNT_NUMBER_RANGE)
+
+# SQL is kept in module constants so the connection's statement cache is
+# keyed on the same string every call and each statement is parsed once
+_SQL_INSERT_ACCOUNT = """
+    INSERT INTO accounts (account_number, first_name, last_name, account_type, currency, balance)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (account_number) DO NOTHING
+    RETURNING id, account_number, first_name, last_name, account_type, currency, balance, created_at
+"""
+
+# Formatted with one "(?, ?, ?, ?, ?, ?)" group per account
+_SQL_INSERT_ACCOUNTS = """
+    INSERT INTO accounts (account_number, first_name, last_name, account_type, currency, balance)
+    VALUES {rows}
+    RETURNING id, account_number, first_name, last_name, account_type, currency, balance, created_at
+"""
+
+# A newly created account's balance is its opening deposit, so the initial
+# deposit transactions can be built from the accounts table itself.
+# Formatted with one placeholder per account number.
+_SQL_INSERT_OPENING_TXNS = """
+    INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
+    SELECT id, 'deposit', balance, balance, 'Initial deposit'
+    FROM accounts WHERE account_number IN ({numbers}) AND balance > 0
+    ORDER BY id
+"""
+
+_SQL_ALL_ACCOUNT_NUMBERS = "SELECT account_number FROM accounts"
+
+_SQL_GET_ACCOUNT = """
+    SELECT id, account_number, first_name, last_name, account_type, currency, balance, created_at
+    FROM accounts WHERE account_number = ?
+"""
+
+_SQL_LIST_ACCOUNTS = """
+    SELECT id, account_number, first_name, last_name, account_type, currency, balance, created_at
+    FROM accounts ORDER BY last_name, first_name
+"""
+
+# Just the columns the account list displays
+_SQL_LIST_ACCOUNT_SUMMARIES = """
+    SELECT account_number, first_name, last_name, account_type, currency, balance
+    FROM accounts ORDER BY last_name, first_name
+"""
+
+_SQL_ACCOUNT_EXISTS = "SELECT 1 FROM accounts WHERE account_number = ?"
+
+_SQL_GET_TXNS = """
+    SELECT id, transaction_type, amount, balance_after, description, created_at
+    FROM transactions
+    WHERE account_id = ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+# Display-ready transaction columns, computed by SQLite
+_SQL_TXN_SUMMARIES = """
+    SELECT substr(created_at, 1, 19), upper(transaction_type),
+           CASE transaction_type WHEN 'deposit' THEN '+' ELSE '-' END,
+           amount, balance_after
+    FROM transactions
+    WHERE account_id = ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+
+_SQL_INSERT_TXN = """
+    INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Balance update for a batch; formatted with the CASE expression and IN list
+_SQL_UPDATE_BAL = """
+    UPDATE accounts SET balance = balance + {delta}
+    WHERE account_number IN ({numbers})
+"""
+
+
+def _check_amounts(amounts: Iterable[int], kind: str) -> None:
+    """Check that every amount is a positive whole number of cents within MAX_CENTS.
+
+    Args:
+        amounts: Amounts in cents
+        kind: What the amounts are for, used in the error (e.g. 'Deposit')
+
+    Raises:
+        ValueError: If any amount is not an int, not positive, or too large
+    """
+    for amount in amounts:
+        if not isinstance(amount, int) or isinstance(amount, bool):
+            raise ValueError(f"{kind} amount must be a whole number of cents")
+        if amount <= 0:
+            raise ValueError(f"{kind} amount must be positive")
+        if amount > MAX_CENTS:
+            raise ValueError(f"{kind} amount is too large")
+
+
+def _account_from_row(row: sqlite3.Row) -> Account:
+    """Build an Account from a stored row."""
+    return Account(*row)
+
+
+def _transaction_from_row(row: sqlite3.Row) -> Transaction:
+    """Build a Transaction from a stored row."""
+    return Transaction(*row)
+
+
+def _iter_rows(cursor: sqlite3.Cursor, batch: int, convert: Callable[[sqlite3.Row], T]) -> Iterator[T]:
+    """Yield a cursor's rows converted to records, fetching them in batches."""
+    while True:
+        rows = cursor.fetchmany(batch)
+        if not rows:
+            break
+        yield from (convert(row) for row in rows)
 
 
 class AccountManager:
@@ -16,145 +152,277 @@ class AccountManager:
             database: Database instance for persistence
         """
         self.db = database
-
-    def generate_account_number(self, account_type: str) -> str:
-        """Generate a unique 6-digit account number.
+        self.conn = database.connect()
+
+        # Write-through cache of account rows keyed by account number
+        self._acct_cache: Dict[str, Account] = {}
+        self._cache_cap = 256
+
+        # LRU cache of transaction listings keyed by (account_number, kind, limit),
+        # and the last list_account_summaries() result. Both are dropped on writes.
+        self._txn_cache: "OrderedDict[Tuple[str, str, int], list]" = OrderedDict()
+        self._txn_cache_cap = 64
+        self._summary_cache: Optional[List[AccountSummary]] = None
+
+    def _cache_account(self, account: Account) -> None:
+        """Store an account in the cache, evicting the oldest entry when full."""
+        self._acct_cache.pop(account.account_number, None)
+        if len(self._acct_cache) >= self._cache_cap:
+            del self._acct_cache[next(iter(self._acct_cache))]
+        self._acct_cache[account.account_number] = account
+
+    def _drop_listings(self, numbers: Iterable[str]) -> None:
+        """Drop cached transaction lists for the given accounts and the account summaries."""
+        numbers = set(numbers)
+        for key in [key for key in self._txn_cache if key[0] in numbers]:
+            del self._txn_cache[key]
+        self._summary_cache = None
+
+    def invalidate(self, account_number: Optional[str] = None) -> None:
+        """Drop cached account data after a change made outside this manager.
 
         Args:
-            account_type: Type of account (checking or savings)
-
-        Returns:
-            Unique 6-digit account number
+            account_number: Account to drop, or None to clear the whole cache
         """
-        while True:
-            # Generate 6-digit account number
-            number = f"{random.randint(100000, 999999)}"
-
-            # Check if unique
-            conn = self.db.connect()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM accounts WHERE account_number = ?", (number,))
-            if cursor.fetchone() is None:
-                return number
-
-    def create_account(self, first_name: str, last_name: str, account_type: str, currency: str, initial_deposit: float = 0.0) -> dict:
-        """Create a new account.
-
-        Args:
-            first_name: Account holder's first name
-            last_name: Account holder's last name
-            account_type: Type of account (checking or savings)
-            currency: Currency code (e.g., 'USD', 'BB')
-            initial_deposit: Initial deposit amount
+        if account_number is None:
+            self._acct_cache.clear()
+            self._txn_cache.clear()
+            self._summary_cache = None
+        else:
+            self._acct_cache.pop(account_number, None)
+            self._drop_listings((account_number,))
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """Group several operations into one transaction with a single commit.
+
+        Operations inside the block are committed together when it exits, or
+        all rolled back if it raises. Nested calls run under a savepoint of
+        the outer unit of work.
+        """
+        try:
+            with self.db.transaction():
+                yield
+        except BaseException:
+            # Cached data may include changes that were just rolled back
+            self.invalidate()
+            raise
+
+    @staticmethod
+    def _validate_new_account(first_name: str, last_name: str, account_type: str, currency: str,
+                              initial_deposit: int) -> Tuple[str, str]:
+        """Check the fields for a new account.
 
         Returns:
-            Dictionary with account details
+            The first and last name with surrounding whitespace removed
+
+        Raises:
+            ValueError: If any field is missing or invalid
         """
-        if not first_name or not first_name.strip():
+        first_name = first_name.strip() if first_name else ""
+        if not first_name:
             raise ValueError("First name is required")
 
-        if not last_name or not last_name.strip():
+        last_name = last_name.strip() if last_name else ""
+        if not last_name:
             raise ValueError("Last name is required")
 
-        if account_type not in ["checking", "savings"]:
+        if account_type not in _ACCOUNT_TYPES:
             raise ValueError("Account type must be 'checking' or 'savings'")
 
-        if not is_valid_currency(currency):
+        if currency not in VALID_CURRENCIES:
             raise ValueError(f"Invalid currency: {currency}")
 
+        if not isinstance(initial_deposit, int) or isinstance(initial_deposit, bool):
+            raise ValueError("Initial deposit must be a whole number of cents")
         if initial_deposit < 0:
             raise ValueError("Initial deposit cannot be negative")
+        if initial_deposit > MAX_CENTS:
+            raise ValueError("Initial deposit is too large")
 
-        account_number = self.generate_account_number(account_type)
+        return first_name, last_name
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
+    def generate_account_numbers(self, n: int) -> List[str]:
+        """Generate unused 6-digit account numbers in one pass.
 
-        # Create account
-        cursor.execute("""
-            INSERT INTO accounts (account_number, first_name, last_name, account_type, currency, balance)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (account_number, first_name.strip(), last_name.strip(), account_type, currency, initial_deposit))
+        Args:
+            n: Number of account numbers to generate
 
-        account_id = cursor.lastrowid
+        Returns:
+            List of n distinct account numbers not present in the database
 
-        # Record initial deposit transaction if > 0
-        if initial_deposit > 0:
-            cursor.execute("""
-                INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
-                VALUES (?, ?, ?, ?, ?)
-            """, (account_id, "deposit", initial_deposit, initial_deposit, "Initial deposit"))
+        Raises:
+            ValueError: If fewer than n account numbers are still free
+        """
+        cursor = self.conn.execute(_SQL_ALL_ACCOUNT_NUMBERS)
+        taken = {row["account_number"] for row in cursor.fetchall()}
+
+        free = _ACCOUNT_NUMBER_SPACE - len(taken)
+        if n > free:
+            raise ValueError(f"Only {free} account numbers are available")
+
+        numbers: List[str] = []
+        while len(numbers) < n:
+            # Oversample a little so one draw usually covers any collisions
+            want = min(n - len(numbers) + 32, _ACCOUNT_NUMBER_SPACE)
+            for value in random.sample(_ACCOUNT_NUMBER_RANGE, want):
+                number = f"{value}"
+                if number not in taken:
+                    taken.add(number)
+                    numbers.append(number)
+                    if len(numbers) == n:
+                        break
+
+        return numbers
+
+    def create_account_many(self, recs: List[dict]) -> List[Account]:
+        """Create several accounts in a single database transaction.
+
+        Args:
+            recs: List of dictionaries with first_name, last_name, account_type,
+                currency and optionally initial_deposit (in cents)
 
-        conn.commit()
+        Returns:
+            List of new accounts, in the same order as recs
 
-        return {
-            "id": account_id,
-            "account_number": account_number,
-            "first_name": first_name.strip(),
-            "last_name": last_name.strip(),
-            "account_type": account_type,
-            "currency": currency,
-            "balance": initial_deposit
-        }
+        Raises:
+            ValueError: If any record is invalid. No accounts are created in that case.
+        """
+        names = [
+            self._validate_new_account(rec["first_name"], rec["last_name"], rec["account_type"],
+                                       rec["currency"], rec.get("initial_deposit", 0))
+            for rec in recs
+        ]
 
-    def get_account(self, account_number: str) -> Optional[dict]:
+        if not recs:
+            return []
+
+        # Each account binds 6 parameters, and a statement may only bind so many
+        per_statement = max(1, self.db.max_variables // 6)
+        created: Dict[str, Account] = {}
+
+        with self.db.transaction() as cursor:
+            # Holding the write lock keeps the generated numbers free until inserted
+            numbers = self.generate_account_numbers(len(recs))
+            for start in range(0, len(recs), per_statement):
+                chunk = numbers[start:start + per_statement]
+                params: List[object] = []
+                for number, (first_name, last_name), rec in zip(chunk, names[start:], recs[start:]):
+                    params.extend((number, first_name, last_name, rec["account_type"],
+                                   rec["currency"], rec.get("initial_deposit", 0)))
+
+                # Insert the chunk's accounts with one multi-row INSERT
+                rows_sql = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                cursor.execute(_SQL_INSERT_ACCOUNTS.format(rows=rows_sql), params)
+                created.update((row["account_number"], _account_from_row(row)) for row in cursor.fetchall())
+
+                # Record initial deposit transactions for accounts opened with money
+                cursor.execute(_SQL_INSERT_OPENING_TXNS.format(numbers=", ".join("?" * len(chunk))), chunk)
+
+        accounts = [created[number] for number in numbers]
+        for account in accounts:
+            self._cache_account(account)
+        self._drop_listings(numbers)
+
+        return accounts
+
+    def create_account(self, first_name: str, last_name: str, account_type: str, currency: str, initial_deposit: int = 0) -> Account:
+        """Create a new account.
+
+        Args:
+            first_name: Account holder's first name
+            last_name: Account holder's last name
+            account_type: Type of account (checking or savings)
+            currency: Currency code (e.g., 'USD', 'BB')
+            initial_deposit: Initial deposit amount in cents
+
+        Returns:
+            The new account
+        """
+        first_name, last_name = self._validate_new_account(first_name, last_name, account_type, currency,
+                                                           initial_deposit)
+        balance = initial_deposit
+
+        with self.db.transaction() as cursor:
+            # Create account, retrying only if the random account number is taken
+            while True:
+                account_number = f"{random.randint(100000, 999999)}"
+                cursor.execute(_SQL_INSERT_ACCOUNT, (account_number, first_name, last_name, account_type, currency, balance))
+                row = cursor.fetchone()
+                if row is not None:
+                    break
+
+            account = _account_from_row(row)
+
+            # Record initial deposit transaction if > 0
+            if balance > 0:
+                cursor.execute(_SQL_INSERT_TXN, (account.id, "deposit", balance, balance, "Initial deposit"))
+
+        self._cache_account(account)
+        self._drop_listings((account.account_number,))
+
+        return account
+
+    def get_account(self, account_number: str) -> Optional[Account]:
         """Get account details by account number.
 
         Args:
             account_number: The account number to look up
 
         Returns:
-            Dictionary with account details or None if not found
+            The account, or None if not found
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, account_number, first_name, last_name, account_type, currency, balance, created_at
-            FROM accounts WHERE account_number = ?
-        """, (account_number,))
+        cached = self._acct_cache.get(account_number)
+        if cached is not None:
+            return cached
+
+        cursor = self.conn.execute(_SQL_GET_ACCOUNT, (account_number,))
 
         row = cursor.fetchone()
         if row:
-            return {
-                "id": row["id"],
-                "account_number": row["account_number"],
-                "first_name": row["first_name"],
-                "last_name": row["last_name"],
-                "account_type": row["account_type"],
-                "currency": row["currency"],
-                "balance": row["balance"],
-                "created_at": row["created_at"]
-            }
+            account = _account_from_row(row)
+            self._cache_account(account)
+            return account
         return None
 
-    def list_accounts(self) -> List[dict]:
+    def list_accounts(self) -> List[Account]:
         """Get all accounts.
 
         Returns:
-            List of account dictionaries
+            List of accounts
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, account_number, first_name, last_name, account_type, currency, balance, created_at
-            FROM accounts ORDER BY last_name, first_name
-        """)
-
-        return [
-            {
-                "id": row["id"],
-                "account_number": row["account_number"],
-                "first_name": row["first_name"],
-                "last_name": row["last_name"],
-                "account_type": row["account_type"],
-                "currency": row["currency"],
-                "balance": row["balance"],
-                "created_at": row["created_at"]
-            }
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_accounts())
+
+    def iter_accounts(self, batch: int = 200) -> Iterator[Account]:
+        """Iterate over all accounts without materializing the full result.
+
+        Args:
+            batch: Number of rows to fetch from SQLite at a time
+
+        Yields:
+            Accounts, ordered by last name then first name
+        """
+        cursor = self.conn.execute(_SQL_LIST_ACCOUNTS)
+        yield from _iter_rows(cursor, batch, _account_from_row)
 
-    def get_transactions(self, account_number: str, limit: int = 10) -> List[dict]:
+    def list_account_summaries(self) -> List[AccountSummary]:
+        """Get the columns needed to list every account, as plain tuples.
+
+        Skips building Row and Account objects, which is most of the cost of
+        refreshing the account list.
+
+        Returns:
+            List of (account_number, first_name, last_name, account_type,
+            currency, balance) tuples, ordered by last name then first name
+        """
+        if self._summary_cache is None:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.arraysize = 128
+            self._summary_cache = cursor.execute(_SQL_LIST_ACCOUNT_SUMMARIES).fetchall()
+        return list(self._summary_cache)
+
+    def get_transactions(self, account_number: str, limit: int = 10) -> List[Transaction]:
         """Get recent transactions for an account.
 
         Args:
@@ -162,87 +430,90 @@ class AccountManager:
             limit: Maximum number of transactions to return (default 10)
 
         Returns:
-            List of transaction dictionaries, most recent first
+            List of transactions, most recent first
         """
-        conn = self.db.connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT t.id, t.transaction_type, t.amount, t.balance_after,
-                   t.description, t.created_at
-            FROM transactions t
-            JOIN accounts a ON t.account_id = a.id
-            WHERE a.account_number = ?
-            ORDER BY t.created_at DESC
-            LIMIT ?
-        """, (account_number, limit))
-
-        return [
-            {
-                "id": row["id"],
-                "transaction_type": row["transaction_type"],
-                "amount": row["amount"],
-                "balance_after": row["balance_after"],
-                "description": row["description"],
-                "created_at": row["created_at"]
-            }
-            for row in cursor.fetchall()
-        ]
+        return self._cached_listing((account_number, "transactions", limit),
+                                    lambda: list(self.iter_transactions(account_number, limit)))
+
+    def list_transaction_summaries(self, account_number: str, limit: int = 10) -> List[TransactionSummary]:
+        """Get recent transactions for an account as display-ready tuples.
+
+        SQLite trims the timestamp, upper-cases the type and picks the sign,
+        so the caller only has to format the amounts.
+
+        Args:
+            account_number: The account number
+            limit: Maximum number of transactions to return (default 10)
+
+        Returns:
+            List of (created_at, transaction_type, sign, amount, balance_after)
+            tuples, most recent first
+        """
+        def load() -> List[TransactionSummary]:
+            account = self.get_account(account_number)
+            if account is None:
+                return []
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            return cursor.execute(_SQL_TXN_SUMMARIES, (account.id, limit)).fetchall()
+
+        return self._cached_listing((account_number, "summaries", limit), load)
+
+    def _cached_listing(self, key: Tuple[str, str, int], load: Callable[[], List[T]]) -> List[T]:
+        """Return a copy of a cached transaction listing, loading it on a miss."""
+        cached = self._txn_cache.get(key)
+        if cached is None:
+            cached = self._txn_cache[key] = load()
+            if len(self._txn_cache) > self._txn_cache_cap:
+                self._txn_cache.popitem(last=False)
+        else:
+            self._txn_cache.move_to_end(key)
+        return list(cached)
+
+    def iter_transactions(self, account_number: str, limit: Optional[int] = None,
+                          batch: int = 200) -> Iterator[Transaction]:
+        """Iterate over an account's transactions, most recent first.
+
+        Args:
+            account_number: The account number
+            limit: Maximum number of transactions to return, or None for all
+            batch: Number of rows to fetch from SQLite at a time
+
+        Yields:
+            Transactions
+        """
+        # Resolve the account id (usually from the cache) so the query can go
+        # straight to the transactions index without joining accounts
+        account = self.get_account(account_number)
+        if account is None:
+            return
+
+        cursor = self.conn.execute(_SQL_GET_TXNS, (account.id, -1 if limit is None else limit))
+        yield from _iter_rows(cursor, batch, _transaction_from_row)
 
-    def deposit(self, account_number: str, amount: float, description: str = "") -> dict:
+    def deposit(self, account_number: str, amount: int, description: str = "") -> dict:
         """Make a deposit to an account.
 
         Args:
             account_number: The account number
-            amount: Amount to deposit (must be positive)
+            amount: Amount to deposit in cents (must be positive)
             description: Optional transaction description
 
         Returns:
             Dictionary with transaction details
 
         Raises:
-            ValueError: If amount is not positive or account not found
+            ValueError: If amount is invalid, the balance would exceed MAX_CENTS,
+                or account not found
         """
-        if amount <= 0:
-            raise ValueError("Deposit amount must be positive")
+        return self.deposit_many([(account_number, amount, description)])[0]
 
-        account = self.get_account(account_number)
-        if not account:
-            raise ValueError(f"Account {account_number} not found")
-
-        new_balance = account["balance"] + amount
-
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        # Update account balance
-        cursor.execute("""
-            UPDATE accounts SET balance = ? WHERE account_number = ?
-        """, (new_balance, account_number))
-
-        # Record transaction
-        cursor.execute("""
-            INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
-            VALUES (?, ?, ?, ?, ?)
-        """, (account["id"], "deposit", amount, new_balance, description or "Deposit"))
-
-        transaction_id = cursor.lastrowid
-        conn.commit()
-
-        return {
-            "account_number": account_number,
-            "transaction_type": "deposit",
-            "amount": amount,
-            "new_balance": new_balance,
-            "description": description or "Deposit",
-            "transaction_id": transaction_id
-        }
-
-    def withdraw(self, account_number: str, amount: float, description: str = "") -> dict:
+    def withdraw(self, account_number: str, amount: int, description: str = "") -> dict:
         """Make a withdrawal from an account.
 
         Args:
             account_number: The account number
-            amount: Amount to withdraw (must be positive)
+            amount: Amount to withdraw in cents (must be positive)
             description: Optional transaction description
 
         Returns:
@@ -251,40 +522,177 @@ class AccountManager:
         Raises:
             ValueError: If amount is invalid, insufficient funds, or account not found
         """
-        if amount <= 0:
-            raise ValueError("Withdrawal amount must be positive")
+        return self.withdraw_many([(account_number, amount, description)])[0]
 
-        account = self.get_account(account_number)
-        if not account:
-            raise ValueError(f"Account {account_number} not found")
-
-        if account["balance"] < amount:
-            raise ValueError("Insufficient funds")
-
-        new_balance = account["balance"] - amount
-
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        # Update account balance
-        cursor.execute("""
-            UPDATE accounts SET balance = ? WHERE account_number = ?
-        """, (new_balance, account_number))
-
-        # Record transaction
-        cursor.execute("""
-            INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
-            VALUES (?, ?, ?, ?, ?)
-        """, (account["id"], "withdrawal", amount, new_balance, description or "Withdrawal"))
-
-        transaction_id = cursor.lastrowid
-        conn.commit()
-
-        return {
-            "account_number": account_number,
-            "transaction_type": "withdrawal",
-            "amount": amount,
-            "new_balance": new_balance,
-            "description": description or "Withdrawal",
-            "transaction_id": transaction_id
-        }
+    def transfer(self, from_account: str, to_account: str, amount: int, description: str = "") -> Tuple[dict, dict]:
+        """Move money from one account to another.
+
+        The withdrawal and deposit are committed together, so either both
+        happen or neither does.
+
+        Args:
+            from_account: Account number to withdraw from
+            to_account: Account number to deposit into
+            amount: Amount to transfer in cents (must be positive)
+            description: Optional transaction description
+
+        Returns:
+            Tuple of (withdrawal, deposit) transaction details
+
+        Raises:
+            ValueError: If the accounts are the same, the amount is invalid,
+                funds are insufficient, or either account is not found
+        """
+        if from_account == to_account:
+            raise ValueError("Cannot transfer to the same account")
+        _check_amounts((amount,), "Transfer")
+
+        # Both legs go through one UPDATE and one executemany
+        withdrawal, deposit = self._apply_many([
+            (from_account, "withdrawal", amount, description or f"Transfer to {to_account}"),
+            (to_account, "deposit", amount, description or f"Transfer from {from_account}"),
+        ])
+        return withdrawal, deposit
+
+    def deposit_many(self, ops: List[Tuple[str, int, str]]) -> List[dict]:
+        """Make several deposits in a single database transaction.
+
+        Args:
+            ops: List of (account_number, amount in cents, description) tuples
+
+        Returns:
+            List of transaction detail dictionaries, in the same order as ops
+
+        Raises:
+            ValueError: If any amount is not a positive int, a balance would exceed
+                MAX_CENTS, or any account is not found. No deposits are recorded
+                in that case.
+        """
+        _check_amounts((amount for _, amount, _ in ops), "Deposit")
+
+        return self._apply_many([(account_number, "deposit", amount, description or "Deposit")
+                                 for account_number, amount, description in ops])
+
+    def withdraw_many(self, ops: List[Tuple[str, int, str]]) -> List[dict]:
+        """Make several withdrawals in a single database transaction.
+
+        Args:
+            ops: List of (account_number, amount in cents, description) tuples
+
+        Returns:
+            List of transaction detail dictionaries, in the same order as ops
+
+        Raises:
+            ValueError: If any amount is invalid, funds are insufficient, or any
+                account is not found. No withdrawals are recorded in that case.
+        """
+        _check_amounts((amount for _, amount, _ in ops), "Withdrawal")
+
+        return self._apply_many([(account_number, "withdrawal", amount, description or "Withdrawal")
+                                 for account_number, amount, description in ops])
+
+    def _apply_many(self, ops: List[Tuple[str, str, int, str]]) -> List[dict]:
+        """Apply a batch of balance changes atomically with one commit.
+
+        The balances are updated with one UPDATE per chunk of accounts, sized
+        to the connection's bound-parameter limit.
+
+        Args:
+            ops: List of (account_number, transaction_type, amount in cents,
+                description) tuples, where transaction_type is 'deposit' or
+                'withdrawal'. An account's withdrawals must not be mixed with
+                its deposits, since only its final balance is checked.
+
+        Returns:
+            List of transaction detail dictionaries, in the same order as ops
+        """
+        if not ops:
+            return []
+
+        # Net balance change per account, in first-seen order
+        deltas: Dict[str, int] = {}
+        for account_number, transaction_type, amount, _ in ops:
+            signed = amount if transaction_type == "deposit" else -amount
+            deltas[account_number] = deltas.get(account_number, 0) + signed
+
+        # A batch can add up past what one bound parameter can hold
+        for delta in deltas.values():
+            if delta > MAX_CENTS:
+                raise ValueError("Balance would exceed the maximum")
+            if delta < -MAX_CENTS:
+                raise ValueError("Insufficient funds")
+
+        numbers = list(deltas)
+        checks_funds = any(op[1] != "deposit" for op in ops)
+        # Each account binds 3 parameters, or 5 with the funds check, and a
+        # statement may only bind so many
+        per_statement = max(1, self.db.max_variables // (5 if checks_funds else 3))
+
+        with self.db.transaction() as cursor:
+            # Apply the balance changes with one UPDATE per chunk of accounts,
+            # all inside the one transaction
+            updated: Dict[str, Tuple[int, int]] = {}
+            for start in range(0, len(numbers), per_statement):
+                chunk = numbers[start:start + per_statement]
+                in_clause = ", ".join("?" * len(chunk))
+                case_sql = f"CASE account_number {' '.join(['WHEN ? THEN ?'] * len(chunk))} END"
+                case_params: List[object] = []
+                for number in chunk:
+                    case_params.extend((number, deltas[number]))
+
+                # Withdrawals only ever lower a balance, so checking the final
+                # balance also covers every intermediate one
+                sql = _SQL_UPDATE_BAL.format(delta=case_sql, numbers=in_clause)
+                params = case_params + chunk
+                if checks_funds:
+                    sql += f" AND balance + {case_sql} >= 0"
+                    params += case_params
+
+                cursor.execute(sql + " RETURNING id, account_number, balance", params)
+                updated.update((row["account_number"], (row["id"], row["balance"])) for row in cursor.fetchall())
+
+            if len(updated) < len(numbers):
+                missing = next(number for number in numbers if number not in updated)
+                cursor.execute(_SQL_ACCOUNT_EXISTS, (missing,))
+                if cursor.fetchone() is None:
+                    raise ValueError(f"Account {missing} not found")
+                raise ValueError("Insufficient funds")
+
+            # An overflowing sum comes back as a REAL; raising rolls it back
+            if any(balance > MAX_CENTS for _, balance in updated.values()):
+                raise ValueError("Balance would exceed the maximum")
+
+            # Replay the ops from each starting balance to get balance_after
+            running = {number: updated[number][1] - deltas[number] for number in numbers}
+            rows = []
+            results = []
+            for account_number, transaction_type, amount, description in ops:
+                running[account_number] += amount if transaction_type == "deposit" else -amount
+                rows.append((updated[account_number][0], transaction_type, amount,
+                             running[account_number], description))
+                results.append({
+                    "account_number": account_number,
+                    "transaction_type": transaction_type,
+                    "amount": amount,
+                    "new_balance": running[account_number],
+                    "description": description,
+                })
+
+            # Record transactions
+            cursor.executemany(_SQL_INSERT_TXN, rows)
+
+            # Transaction ids are contiguous since the batch holds the write lock
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        # Write the new balances through to any cached accounts
+        for number in numbers:
+            cached = self._acct_cache.get(number)
+            if cached is not None:
+                self._acct_cache[number] = replace(cached, balance=updated[number][1])
+        self._drop_listings(numbers)
+
+        first_id = last_id - len(rows) + 1
+        for offset, result in enumerate(results):
+            result["transaction_id"] = first_id + offset
+
+        return results
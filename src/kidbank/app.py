@@ -1,17 +1,57 @@
 """Main application class for Kidbank."""
 
-from typing import Dict
+import threading
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Callable, Dict, Optional
+from textual import work
 from textual.app import App, ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Vertical, Horizontal, VerticalScroll
-from textual.widgets import Header, Footer, Static, Button, Input, Label, ListView, ListItem
+from textual.widgets import Header, Footer, Static, Button, Input, Label, DataTable
 from textual.binding import Binding
 
 from .database import Database
-from .accounts import AccountManager
+from .accounts import AccountManager, MAX_CENTS
+from .models import Account
 from .currency import get_currency, get_available_currencies
 from .printer import Printer, PrinterError
 
+# Fixed screen text, built once at import
+_DIVIDER = "═" * 60
+_MENU_HELP = "\n[N] New Account  [Q] Quit"
+_DETAIL_HELP = ("\n[D] Deposit  [W] Withdraw  [V] View  [Shift+V] Detailed  [P] Print  "
+                "[Shift+P] Print Detailed  [ESC] Back")
+_CLOSE_HELP = "\n[ENTER] or [ESC] to close"
+_CONFIRMATION_HELP = "\n[ENTER] or [ESC] to continue without printing"
+_TRANSACTION_HELP = "\n[ESC] Cancel"
+
+# Held by print workers so documents go to the printer one at a time,
+# whichever screen started them
+_PRINT_LOCK = threading.Lock()
+
+
+def _parse_cents(text: str) -> int:
+    """Parse an amount typed in major units (e.g. '12.34') into integer cents.
+
+    Args:
+        text: The amount as entered
+
+    Returns:
+        The amount in cents, rounded half-to-even to the nearest cent
+
+    Raises:
+        ValueError: If text is not a finite number, or is too large to store
+    """
+    try:
+        cents = (Decimal(text) * 100).to_integral_value(rounding=ROUND_HALF_EVEN)
+    except ArithmeticError:
+        # InvalidOperation for non-numbers, Overflow for exponents like '1e999999'
+        raise ValueError("Invalid amount") from None
+    # Checked as a Decimal so a huge entry is never expanded to an int
+    if not cents.is_finite() or abs(cents) > MAX_CENTS:
+        raise ValueError("Invalid amount")
+    return int(cents)
+
 
 class MainMenuScreen(Screen):
     """Main menu showing list of accounts."""
@@ -30,42 +70,47 @@ class MainMenuScreen(Screen):
         yield Header()
         yield Container(
             Static("KIDBANK TERMINAL SYSTEM v1.0", id="title"),
-            Static("═" * 60, id="divider"),
-            ListView(id="account_list"),
-            Static("\n[N] New Account  [Q] Quit", id="menu_help"),
+            Static(_DIVIDER, id="divider"),
+            Static("No accounts found. Press [N] to create one.", id="account_empty"),
+            DataTable(id="account_list", cursor_type="row"),
+            Static(_MENU_HELP, id="menu_help"),
         )
         yield Footer()
 
     def on_mount(self) -> None:
         """Load accounts when screen is mounted."""
+        self.query_one("#account_list", DataTable).add_columns("Account", "Name", "Type", "Balance")
         self.refresh_account_list()
 
     def refresh_account_list(self, result=None) -> None:
         """Refresh the account list."""
-        list_view = self.query_one("#account_list", ListView)
-        list_view.clear()
-
-        accounts = self.account_manager.list_accounts()
-
-        if not accounts:
-            list_view.append(ListItem(Label("No accounts found. Press [N] to create one.")))
-        else:
-            for account in accounts:
-                name = f"{account['first_name']} {account['last_name']}"
-                acct_num = account['account_number']
-                acct_type = account["account_type"].upper()
-                currency = get_currency(account["currency"])
-                balance_str = currency.format_amount(account["balance"])
-                label = f"{acct_num}  {name:25s}  {acct_type:10s}  {balance_str}"
-                list_view.append(ListItem(Label(label), name=account["account_number"]))
-
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        # The table only renders the rows in view, so a long list costs no
+        # widgets per account
+        table = self.query_one("#account_list", DataTable)
+        table.clear()
+
+        accounts = self.account_manager.list_account_summaries()
+        self.query_one("#account_empty", Static).display = not accounts
+        table.display = bool(accounts)
+
+        # Most accounts share a currency, so resolve each code only once
+        formatters: Dict[str, Callable[[int], str]] = {}
+        for acct_num, first, last, acct_type, ccode, balance in accounts:
+            format_amount = formatters.get(ccode)
+            if format_amount is None:
+                format_amount = formatters[ccode] = get_currency(ccode).format_amount
+            table.add_row(acct_num, f"{first} {last}", acct_type.upper(), format_amount(balance), key=acct_num)
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle account selection."""
-        if event.item.name:  # Has an account number
-            self.app.push_screen(
-                AccountDetailScreen(self.account_manager, event.item.name),
-                callback=self.refresh_account_list
-            )
+        # Every row is added keyed by its account number
+        account_number = event.row_key.value
+        if account_number is None:
+            return
+        self.app.push_screen(
+            AccountDetailScreen(self.account_manager, account_number),
+            callback=self.refresh_account_list
+        )
 
     def action_new_account(self) -> None:
         """Open new account creation screen."""
@@ -89,26 +134,31 @@ class AccountDetailScreen(Screen):
         super().__init__()
         self.account_manager = account_manager
         self.account_number = account_number
+        # Account as of the last refresh; refreshed after every transaction
+        self._account: Optional[Account] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Header()
         yield Container(
             Static(id="account_info"),
-            Static("═" * 60, id="divider"),
+            Static(_DIVIDER, id="divider"),
             Static("RECENT TRANSACTIONS:", id="transactions_header"),
-            ListView(id="transaction_list"),
-            Static("\n[D] Deposit  [W] Withdraw  [V] View  [Shift+V] Detailed  [P] Print  [Shift+P] Print Detailed  [ESC] Back", id="detail_help"),
+            Static("No transactions", id="transaction_empty"),
+            DataTable(id="transaction_list", cursor_type="row"),
+            Static(_DETAIL_HELP, id="detail_help"),
         )
         yield Footer()
 
     def on_mount(self) -> None:
         """Load account details when screen is mounted."""
+        self.query_one("#transaction_list", DataTable).add_columns("Date", "Type", "Amount", "Balance")
         self.refresh_details()
 
     def refresh_details(self, result=None) -> None:
         """Refresh account details and transactions."""
         account = self.account_manager.get_account(self.account_number)
+        self._account = account
         if not account:
             self.app.pop_screen()
             return
@@ -126,72 +176,81 @@ class AccountDetailScreen(Screen):
         )
 
         # Update transaction list
-        list_view = self.query_one("#transaction_list", ListView)
-        list_view.clear()
-
-        transactions = self.account_manager.get_transactions(self.account_number, limit=10)
-
-        if not transactions:
-            list_view.append(ListItem(Label("No transactions")))
-        else:
-            for txn in transactions:
-                txn_type = txn["transaction_type"].upper()
-                amount_str = currency.format_amount(txn["amount"])
-                balance_str = currency.format_amount(txn["balance_after"])
-                date = txn["created_at"][:19]  # Trim microseconds
-                sign = "+" if txn_type == "DEPOSIT" else "-"
-                label = f"{date}  {txn_type:12s}  {sign}{amount_str}  Bal: {balance_str}"
-                list_view.append(ListItem(Label(label)))
+        table = self.query_one("#transaction_list", DataTable)
+        table.clear()
+
+        transactions = self.account_manager.list_transaction_summaries(self.account_number, limit=10)
+        self.query_one("#transaction_empty", Static).display = not transactions
+        table.display = bool(transactions)
+
+        # Format the money columns in two batched passes
+        amounts = currency.format_amounts([txn[3] for txn in transactions])
+        balances = currency.format_amounts([txn[4] for txn in transactions])
+        table.add_rows(
+            (created_at, txn_type, f"{sign}{amount}", balance)
+            for (created_at, txn_type, sign, _, _), amount, balance in zip(transactions, amounts, balances)
+        )
 
     def action_deposit(self) -> None:
         """Open deposit form."""
         self.app.push_screen(
-            TransactionScreen(self.account_manager, self.account_number, "deposit"),
+            TransactionScreen(self.account_manager, self.account_number, "deposit", self._account),
             callback=self.refresh_details
         )
 
     def action_withdraw(self) -> None:
         """Open withdrawal form."""
         self.app.push_screen(
-            TransactionScreen(self.account_manager, self.account_number, "withdrawal"),
+            TransactionScreen(self.account_manager, self.account_number, "withdrawal", self._account),
             callback=self.refresh_details
         )
 
     def action_print_statement(self) -> None:
         """Print account statement."""
-        account = self.account_manager.get_account(self.account_number)
+        account = self._account
         if not account:
             return
 
         transactions = self.account_manager.get_transactions(self.account_number, limit=20)
-
-        try:
-            Printer.print_statement(account, transactions)
-            # Show success message
-            self.app.push_screen(MessageScreen("Statement sent to printer successfully!"))
-        except PrinterError as e:
-            # Show error message
-            self.app.push_screen(MessageScreen(f"Print failed: {str(e)}", is_error=True))
+        self._print_in_background(Printer.print_statement, account, transactions,
+                                  success="Statement sent to printer successfully!")
 
     def action_print_detailed_statement(self) -> None:
         """Print detailed account statement with transaction notes."""
-        account = self.account_manager.get_account(self.account_number)
+        account = self._account
         if not account:
             return
 
         transactions = self.account_manager.get_transactions(self.account_number, limit=20)
-
+        self._print_in_background(Printer.print_detailed_statement, account, transactions,
+                                  success="Detailed statement sent to printer successfully!")
+
+    @work(thread=True, group="print")
+    def _print_in_background(self, print_fn: Callable[..., None], *args, success: str) -> None:
+        """Run a Printer call on a worker thread so the UI stays responsive.
+
+        Args:
+            print_fn: Printer method to call
+            *args: Arguments for print_fn
+            success: Message to show once the document has been sent
+        """
         try:
-            Printer.print_detailed_statement(account, transactions)
-            # Show success message
-            self.app.push_screen(MessageScreen("Detailed statement sent to printer successfully!"))
+            with _PRINT_LOCK:
+                print_fn(*args)
         except PrinterError as e:
             # Show error message
-            self.app.push_screen(MessageScreen(f"Print failed: {str(e)}", is_error=True))
+            self.app.call_from_thread(self._show_message, f"Print failed: {str(e)}", True)
+        else:
+            # Show success message
+            self.app.call_from_thread(self._show_message, success)
+
+    def _show_message(self, message: str, is_error: bool = False) -> None:
+        """Show a message screen; called on the UI thread so the screen is built there."""
+        self.app.push_screen(MessageScreen(message, is_error=is_error))
 
     def action_view_statement(self) -> None:
         """View account statement on screen."""
-        account = self.account_manager.get_account(self.account_number)
+        account = self._account
         if not account:
             return
 
@@ -201,7 +260,7 @@ class AccountDetailScreen(Screen):
 
     def action_view_detailed_statement(self) -> None:
         """View detailed account statement on screen."""
-        account = self.account_manager.get_account(self.account_number)
+        account = self._account
         if not account:
             return
 
@@ -233,11 +292,11 @@ class MessageScreen(Screen):
         yield Header()
         yield Container(
             Static(title, id="title"),
-            Static("═" * 60, id="divider"),
+            Static(_DIVIDER, id="divider"),
             Static(self.message, id="message_content"),
             Static(""),
             Button("Close", id="btn_close", variant="primary"),
-            Static("\n[ENTER] or [ESC] to close", id="message_help"),
+            Static(_CLOSE_HELP, id="message_help"),
         )
         yield Footer()
 
@@ -269,9 +328,9 @@ class StatementViewScreen(Screen):
         yield Header()
         yield VerticalScroll(
             Static(self.title, id="title"),
-            Static("═" * 60, id="divider"),
+            Static(_DIVIDER, id="divider"),
             Static(self.content, id="statement_content"),
-            Static("\n[ENTER] or [ESC] to close", id="statement_help"),
+            Static(_CLOSE_HELP, id="statement_help"),
         )
         yield Footer()
 
@@ -293,17 +352,17 @@ class CreateAccountScreen(Screen):
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        # Build currency buttons dynamically
-        currencies = get_available_currencies()
-        currency_buttons = [
-            Button(curr.name, id=f"btn_currency_{curr.code}", variant="primary")
-            for curr in currencies
-        ]
+        # Build currency buttons dynamically, keeping references so presses
+        # can restyle them without querying the DOM
+        self._currency_buttons: Dict[str, Button] = {
+            curr.code: Button(curr.name, id=f"btn_currency_{curr.code}", variant="primary")
+            for curr in get_available_currencies()
+        }
 
         yield Header()
         yield VerticalScroll(
             Static("CREATE NEW ACCOUNT", id="title"),
-            Static("═" * 60, id="divider"),
+            Static(_DIVIDER, id="divider"),
             Static(""),
             Label("First Name:"),
             Input(placeholder="First name", id="first_name"),
@@ -319,7 +378,7 @@ class CreateAccountScreen(Screen):
             ),
             Static(""),
             Label("Currency:"),
-            Horizontal(*currency_buttons, id="currency_buttons"),
+            Horizontal(*self._currency_buttons.values(), id="currency_buttons"),
             Static(""),
             Label("Initial Deposit:"),
             Input(placeholder="0.00", id="initial_deposit"),
@@ -351,13 +410,8 @@ class CreateAccountScreen(Screen):
             currency_code = event.button.id.replace("btn_currency_", "")
             self.selected_currency = currency_code
             # Update all currency buttons
-            for curr in get_available_currencies():
-                btn_id = f"btn_currency_{curr.code}"
-                try:
-                    btn = self.query_one(f"#{btn_id}", Button)
-                    btn.variant = "success" if curr.code == currency_code else "primary"
-                except:
-                    pass
+            for code, btn in self._currency_buttons.items():
+                btn.variant = "success" if code == currency_code else "primary"
         elif event.button.id == "btn_create":
             self.create_account()
 
@@ -377,7 +431,7 @@ class CreateAccountScreen(Screen):
             first_name = self.query_one("#first_name", Input).value.strip()
             last_name = self.query_one("#last_name", Input).value.strip()
             deposit_input = self.query_one("#initial_deposit", Input).value.strip()
-            initial_deposit = float(deposit_input) if deposit_input else 0.0
+            initial_deposit = _parse_cents(deposit_input) if deposit_input else 0
 
             if initial_deposit < 0:
                 error_widget.update("Error: Initial deposit cannot be negative")
@@ -405,17 +459,17 @@ class TransactionConfirmationScreen(Screen):
     ]
 
     def __init__(self, account_manager: AccountManager, account_number: str,
-                 transaction: Dict, transaction_id: int):
+                 transaction: Dict, transaction_id: int, account: Optional[Account] = None):
         super().__init__()
         self.account_manager = account_manager
         self.account_number = account_number
         self.transaction = transaction
         self.transaction_id = transaction_id
+        self.account = account or account_manager.get_account(account_number)
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        account = self.account_manager.get_account(self.account_number)
-        currency = get_currency(account["currency"])
+        currency = get_currency(self.account["currency"])
 
         txn_type = self.transaction["transaction_type"].upper()
         amount = currency.format_amount(self.transaction["amount"])
@@ -424,7 +478,7 @@ class TransactionConfirmationScreen(Screen):
         yield Header()
         yield Container(
             Static("TRANSACTION SUCCESSFUL", id="title"),
-            Static("═" * 60, id="divider"),
+            Static(_DIVIDER, id="divider"),
             Static(f"\n{txn_type}: {amount}", id="transaction_summary"),
             Static(f"New Balance: {new_balance}\n", id="balance_info"),
             Horizontal(
@@ -432,7 +486,7 @@ class TransactionConfirmationScreen(Screen):
                 Button("Continue", id="btn_continue", variant="primary"),
                 id="confirmation_buttons",
             ),
-            Static("\n[ENTER] or [ESC] to continue without printing", id="confirmation_help"),
+            Static(_CONFIRMATION_HELP, id="confirmation_help"),
             Static(id="print_error"),
         )
         yield Footer()
@@ -446,21 +500,33 @@ class TransactionConfirmationScreen(Screen):
 
     def print_receipt(self) -> None:
         """Print the transaction receipt."""
-        account = self.account_manager.get_account(self.account_number)
+        account = self.account
         if not account:
             return
 
+        self._print_receipt_in_background(account)
+
+    @work(thread=True, group="print")
+    def _print_receipt_in_background(self, account: Account) -> None:
+        """Send the receipt to the printer on a worker thread."""
         try:
-            Printer.print_receipt(account, self.transaction, self.transaction_id)
-            # Show success and close after a moment
-            error_widget = self.query_one("#print_error", Static)
-            error_widget.update("Receipt sent to printer!")
-            # Auto-close after showing message
-            self.set_timer(1.5, lambda: self.dismiss(None))
+            with _PRINT_LOCK:
+                Printer.print_receipt(account, self.transaction, self.transaction_id)
         except PrinterError as e:
             # Show error message
-            error_widget = self.query_one("#print_error", Static)
-            error_widget.update(f"Print failed: {str(e)}")
+            self.app.call_from_thread(self._show_print_status, f"Print failed: {str(e)}")
+        else:
+            self.app.call_from_thread(self._receipt_printed)
+
+    def _show_print_status(self, message: str) -> None:
+        """Show a print status message under the buttons."""
+        self.query_one("#print_error", Static).update(message)
+
+    def _receipt_printed(self) -> None:
+        """Show success and close after a moment."""
+        self._show_print_status("Receipt sent to printer!")
+        # Auto-close after showing message
+        self.set_timer(1.5, lambda: self.dismiss(None))
 
     def action_back(self) -> None:
         """Continue without printing."""
@@ -474,20 +540,20 @@ class TransactionScreen(Screen):
         ("escape", "back", "Cancel"),
     ]
 
-    def __init__(self, account_manager: AccountManager, account_number: str, transaction_type: str):
+    def __init__(self, account_manager: AccountManager, account_number: str, transaction_type: str,
+                 account: Optional[Account] = None):
         super().__init__()
         self.account_manager = account_manager
         self.account_number = account_number
         self.transaction_type = transaction_type
+        self.account = account or account_manager.get_account(account_number)
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         title = "DEPOSIT" if self.transaction_type == "deposit" else "WITHDRAWAL"
 
-        # Get account info for currency display
-        account = self.account_manager.get_account(self.account_number)
-        if account:
-            currency = get_currency(account["currency"])
+        if self.account:
+            currency = get_currency(self.account["currency"])
             amount_label = f"\nAmount ({currency.symbol}):"
         else:
             amount_label = "\nAmount:"
@@ -495,7 +561,7 @@ class TransactionScreen(Screen):
         yield Header()
         yield Container(
             Static(title, id="title"),
-            Static("═" * 60, id="divider"),
+            Static(_DIVIDER, id="divider"),
             Static(f"Account: {self.account_number}", id="account_info"),
             Vertical(
                 Label(amount_label),
@@ -504,7 +570,7 @@ class TransactionScreen(Screen):
                 Input(placeholder="Transaction description", id="description"),
                 Static(""),
                 Button(f"Submit {title.capitalize()}", id="btn_submit", variant="success"),
-                Static("\n[ESC] Cancel", id="transaction_help"),
+                Static(_TRANSACTION_HELP, id="transaction_help"),
                 id="form_container",
             ),
             Static(id="error_message"),
@@ -530,7 +596,7 @@ class TransactionScreen(Screen):
                 error_widget.update("Error: Please enter an amount")
                 return
 
-            amount = float(amount_input)
+            amount = _parse_cents(amount_input)
             description = self.query_one("#description", Input).value.strip()
 
             if self.transaction_type == "deposit":
@@ -545,7 +611,8 @@ class TransactionScreen(Screen):
                     self.account_manager,
                     self.account_number,
                     result,
-                    transaction_id
+                    transaction_id,
+                    self.account,
                 ),
                 callback=lambda _: self.dismiss(result)
             )
@@ -561,75 +628,7 @@ class TransactionScreen(Screen):
 class KidbankApp(App):
     """A retro terminal-based banking application."""
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    #title {
-        text-style: bold;
-        padding: 1;
-        content-align: center middle;
-    }
-
-    #divider {
-        color: $text-muted;
-        padding: 0 1;
-    }
-
-    #account_list {
-        height: 1fr;
-        margin: 1;
-    }
-
-    #transaction_list {
-        height: 1fr;
-        margin: 1;
-    }
-
-    #menu_help, #detail_help, #create_help, #transaction_help, #message_help, #confirmation_help, #statement_help {
-        color: $text-muted;
-        padding: 1;
-    }
-
-    #statement_content {
-        padding: 1 2;
-    }
-
-    #message_content, #transaction_summary, #balance_info {
-        padding: 1 2;
-    }
-
-    #confirmation_buttons {
-        padding: 1;
-        height: auto;
-    }
-
-    #print_error {
-        color: $success;
-        padding: 1 2;
-    }
-
-    #form_container {
-        padding: 1 2;
-        height: auto;
-    }
-
-    #error_message {
-        color: $error;
-        padding: 1 2;
-    }
-
-    Horizontal {
-        height: auto;
-        width: 100%;
-    }
-
-    Button {
-        margin: 1 1;
-        min-width: 16;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         ("q", "quit", "Quit"),
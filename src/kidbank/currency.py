@@ -1,6 +1,8 @@
 """Currency configuration and formatting."""
 
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, FrozenSet, Iterable, List, Mapping, Sequence, Tuple
 
 
 class Currency:
@@ -18,29 +20,72 @@ class Currency:
         self.name = name
         self.symbol = symbol
 
-    def format_amount(self, amount: float) -> str:
-        """Format an amount with this currency.
+        # Formats an amount in cents with this currency, e.g. '$1,000.00' or
+        # '1,000.00 BB', and a whole column of amounts in one pass. Built once
+        # here for this symbol so rendering a row does not branch on the
+        # currency code or look up the symbol.
+        self.format_amount: Callable[[int], str]
+        self.format_amounts: Callable[[Iterable[int]], List[str]]
+        # Only USD puts the symbol first
+        self.format_amount, self.format_amounts = _make_formatters(symbol, prefix=code == "USD")
 
-        Args:
-            amount: The amount to format
 
-        Returns:
-            Formatted string (e.g., '$1,000.00' or '1,000.00 BB')
-        """
-        if self.code == "USD":
-            return f"{self.symbol}{amount:,.2f}"
-        else:
-            # For other currencies, put symbol after
-            return f"{amount:,.2f} {self.symbol}"
+def _format_cents(cents: int) -> str:
+    """Format integer cents as a grouped decimal string (e.g., 100050 -> '1,000.50')."""
+    if cents < 0:
+        return f"-{_format_cents(-cents)}"
+    return f"{cents // 100:,}.{cents % 100:02d}"
+
 
+def _make_formatters(symbol: str, prefix: bool) -> Tuple[Callable[[int], str], Callable[[Iterable[int]], List[str]]]:
+    """Build the single and batch amount formatters for one currency symbol.
+
+    Args:
+        symbol: Display symbol
+        prefix: True to put the symbol before the amount, False to put it after
 
-# Define available currencies
-CURRENCIES: Dict[str, Currency] = {
+    Returns:
+        Tuple of (format_amount, format_amounts)
+    """
+    # The symbol is fixed in each closure and non-negative amounts, the
+    # common case, are formatted inline without a helper call
+    if prefix:
+        def format_amount(cents: int) -> str:
+            if cents >= 0:
+                return f"{symbol}{cents // 100:,}.{cents % 100:02d}"
+            return f"{symbol}{_format_cents(cents)}"
+
+        def format_amounts(amounts: Iterable[int]) -> List[str]:
+            return [f"{symbol}{c // 100:,}.{c % 100:02d}" if c >= 0 else f"{symbol}{_format_cents(c)}"
+                    for c in amounts]
+    else:
+        def format_amount(cents: int) -> str:
+            if cents >= 0:
+                return f"{cents // 100:,}.{cents % 100:02d} {symbol}"
+            return f"{_format_cents(cents)} {symbol}"
+
+        def format_amounts(amounts: Iterable[int]) -> List[str]:
+            return [f"{c // 100:,}.{c % 100:02d} {symbol}" if c >= 0 else f"{_format_cents(c)} {symbol}"
+                    for c in amounts]
+
+    return format_amount, format_amounts
+
+
+# Define available currencies. The mapping is read-only; the set of
+# currencies is fixed at import.
+CURRENCIES: Mapping[str, Currency] = MappingProxyType({
     "USD": Currency("USD", "US Dollars", "$"),
     "BB": Currency("BB", "BrainBucks", "BB"),
-}
+})
+
+# All currencies in display order, shared by every caller
+_CUR_LIST: Tuple[Currency, ...] = tuple(CURRENCIES.values())
+
+# Codes of all available currencies, for fast membership checks
+VALID_CURRENCIES: FrozenSet[str] = frozenset(CURRENCIES)
 
 
+@lru_cache(maxsize=None)
 def get_currency(code: str) -> Currency:
     """Get a currency by its code.
 
@@ -53,18 +98,19 @@ def get_currency(code: str) -> Currency:
     Raises:
         ValueError: If currency code is not found
     """
-    if code not in CURRENCIES:
-        raise ValueError(f"Unknown currency: {code}")
-    return CURRENCIES[code]
+    try:
+        return CURRENCIES[code]
+    except KeyError:
+        raise ValueError(f"Unknown currency: {code}") from None
 
 
-def get_available_currencies() -> List[Currency]:
-    """Get list of all available currencies.
+def get_available_currencies() -> Sequence[Currency]:
+    """Get all available currencies.
 
     Returns:
-        List of Currency objects
+        Immutable sequence of Currency objects
     """
-    return list(CURRENCIES.values())
+    return _CUR_LIST
 
 
 def is_valid_currency(code: str) -> bool:
@@ -76,4 +122,4 @@ def is_valid_currency(code: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return code in CURRENCIES
+    return code in VALID_CURRENCIES
@@ -1,8 +1,52 @@
 """Database management for Kidbank."""
 
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+# Stored in the database's user_version once the schema is up to date.
+# Bump it whenever _initialize_schema gains a step.
+SCHEMA_VERSION = 1
+
+# Oldest SQLite with every feature the queries use (RETURNING arrived in 3.35)
+_MIN_SQLITE_VERSION = (3, 35, 0)
+
+# Table definitions, formatted with the table name so migrations can build
+# a replacement table alongside the old one. Money columns hold integer
+# cents (minor units) rather than floating point major units.
+_ACCOUNTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        account_number TEXT UNIQUE NOT NULL,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        account_type TEXT NOT NULL,
+        currency TEXT NOT NULL DEFAULT 'USD',
+        balance INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+_TRANSACTIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        account_id INTEGER NOT NULL,
+        transaction_type TEXT NOT NULL,
+        amount INTEGER NOT NULL,
+        balance_after INTEGER NOT NULL,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (account_id) REFERENCES accounts (id)
+    )
+"""
+
+# Columns added to the accounts table after its first release
+_ADDED_ACCOUNT_COLUMNS = (
+    ("first_name", "TEXT DEFAULT ''"),
+    ("last_name", "TEXT DEFAULT ''"),
+    ("currency", "TEXT DEFAULT 'USD'"),
+)
 
 
 class Database:
@@ -21,63 +65,197 @@ class Database:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn: Optional[sqlite3.Connection] = None
 
+        # Number of transaction() blocks currently open on the connection
+        self._tx_depth = 0
+
+        # Most bound parameters one statement may take, read from the
+        # connection once it is open. 999 is SQLite's default before 3.32.
+        self.max_variables = 999
+
     def connect(self) -> sqlite3.Connection:
-        """Establish database connection."""
+        """Establish database connection.
+
+        The connection is opened and configured once, then reused for the
+        lifetime of the process.
+
+        Raises:
+            RuntimeError: If the SQLite library is older than the queries need
+        """
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
+            if sqlite3.sqlite_version_info < _MIN_SQLITE_VERSION:
+                required = ".".join(map(str, _MIN_SQLITE_VERSION))
+                raise RuntimeError(f"Kidbank needs SQLite {required} or newer; "
+                                   f"this Python uses SQLite {sqlite3.sqlite_version}")
+
+            # isolation_level=None leaves transaction control to explicit
+            # BEGIN/COMMIT statements instead of the driver's implicit BEGIN.
+            # Only the UI thread uses the database: _tx_depth and the
+            # AccountManager caches are unlocked, so print workers are handed
+            # their data rather than reading it. The default same-thread
+            # check is kept to catch any use from another thread.
+            self.conn = sqlite3.connect(self.db_path, cached_statements=512, isolation_level=None)
             self.conn.row_factory = sqlite3.Row
-            self._initialize_schema()
+            self._configure_connection()
+            # Connection.getlimit is only available from Python 3.11
+            if hasattr(self.conn, "getlimit"):
+                self.max_variables = self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+
+            # Only run the DDL when the file predates the current schema
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._initialize_schema()
         return self.conn
 
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """Execute a statement on the shared connection.
+
+        Statements go through the connection's prepared-statement cache, so
+        repeating the same SQL text skips parsing and planning.
+
+        Args:
+            sql: SQL statement
+            params: Parameters for the statement's placeholders
+
+        Returns:
+            Cursor holding the statement's results
+        """
+        return self.connect().execute(sql, params)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> sqlite3.Cursor:
+        """Execute a statement once per parameter set on the shared connection.
+
+        Args:
+            sql: SQL statement
+            seq_of_params: Parameter sets, one per execution
+
+        Returns:
+            Cursor used for the executions
+        """
+        return self.connect().executemany(sql, seq_of_params)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of statements in one write transaction with a single commit.
+
+        The outermost block runs BEGIN IMMEDIATE ... COMMIT, taking the write
+        lock up front so the transaction never has to upgrade from a read lock
+        midway. Nested blocks run under a savepoint instead, so a failure
+        inside one undoes only that block. Any exception rolls the block back
+        and is re-raised.
+
+        Yields:
+            Cursor to execute the statements on
+        """
+        cursor = self.connect().cursor()
+        depth = self._tx_depth
+        rollback: Tuple[str, ...]
+        if depth:
+            begin, commit = f"SAVEPOINT tx{depth}", f"RELEASE tx{depth}"
+            rollback = (f"ROLLBACK TO tx{depth}", commit)
+        else:
+            begin, commit, rollback = "BEGIN IMMEDIATE", "COMMIT", ("ROLLBACK",)
+
+        cursor.execute(begin)
+        self._tx_depth += 1
+        try:
+            yield cursor
+        except BaseException:
+            for sql in rollback:
+                cursor.execute(sql)
+            raise
+        else:
+            cursor.execute(commit)
+        finally:
+            self._tx_depth = depth
+
+    def _configure_connection(self):
+        """Tune the connection for a single long-lived process."""
+        # WAL lets readers proceed during writes, and with synchronous=NORMAL
+        # commits no longer fsync the WAL every time while staying crash-safe
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        self.conn.execute("PRAGMA mmap_size=268435456")  # Read pages via a 256 MB memory map
+
     def _initialize_schema(self):
-        """Create database tables if they don't exist."""
+        """Create or upgrade the database tables to SCHEMA_VERSION.
+
+        Every step is idempotent, and the version is recorded last, so an
+        interrupted upgrade simply runs again on the next connect.
+        """
         cursor = self.conn.cursor()
 
         # Accounts table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS accounts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                account_number TEXT UNIQUE NOT NULL,
-                first_name TEXT NOT NULL,
-                last_name TEXT NOT NULL,
-                account_type TEXT NOT NULL,
-                currency TEXT NOT NULL DEFAULT 'USD',
-                balance REAL NOT NULL DEFAULT 0.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Add name columns to existing tables (for migration)
-        try:
-            cursor.execute("ALTER TABLE accounts ADD COLUMN first_name TEXT DEFAULT ''")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        cursor.execute(_ACCOUNTS_TABLE.format(name="accounts"))
 
-        try:
-            cursor.execute("ALTER TABLE accounts ADD COLUMN last_name TEXT DEFAULT ''")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # Add columns missing from tables created by older versions
+        cursor.execute("SELECT name FROM pragma_table_info('accounts')")
+        columns = {row["name"] for row in cursor.fetchall()}
+        for column, definition in _ADDED_ACCOUNT_COLUMNS:
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE accounts ADD COLUMN {column} {definition}")
 
+        # Transactions table
+        cursor.execute(_TRANSACTIONS_TABLE.format(name="transactions"))
+
+        self._migrate_to_cents(cursor)
+
+        # Index for the hot transaction lookups; account numbers are already
+        # indexed by the table's UNIQUE constraint. Entries are ordered by id
+        # within each account, which serves the newest-first LIMIT queries
+        # without a sort and, unlike created_at, never ties.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_txn_account ON transactions (account_id)")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_to_cents(self, cursor: sqlite3.Cursor):
+        """Convert tables that still store money as REAL major units to integer cents.
+
+        SQLite cannot change a column's type in place, so both tables are
+        rebuilt under their final definitions and the old ones dropped. Each
+        table's AUTOINCREMENT high-water mark is carried over, so ids of
+        deleted rows, which may already be on printed receipts, stay retired.
+        """
+        cursor.execute("SELECT type FROM pragma_table_info('accounts') WHERE name = 'balance'")
+        if cursor.fetchone()["type"].upper() != "REAL":
+            return
+
+        cursor.execute("BEGIN IMMEDIATE")
         try:
-            cursor.execute("ALTER TABLE accounts ADD COLUMN currency TEXT DEFAULT 'USD'")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            # Dropping a table deletes its sqlite_sequence row, so save them first
+            cursor.execute("SELECT name, seq FROM sqlite_sequence WHERE name IN ('accounts', 'transactions')")
+            sequences = [(row["name"], row["seq"]) for row in cursor.fetchall()]
 
-        # Transactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                account_id INTEGER NOT NULL,
-                transaction_type TEXT NOT NULL,
-                amount REAL NOT NULL,
-                balance_after REAL NOT NULL,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (account_id) REFERENCES accounts (id)
-            )
-        """)
-
-        self.conn.commit()
+            cursor.execute(_ACCOUNTS_TABLE.format(name="accounts_new"))
+            cursor.execute("""
+                INSERT INTO accounts_new (id, account_number, first_name, last_name, account_type,
+                                          currency, balance, created_at)
+                SELECT id, account_number, first_name, last_name, account_type,
+                       currency, CAST(ROUND(balance * 100) AS INTEGER), created_at
+                FROM accounts
+            """)
+            cursor.execute("DROP TABLE accounts")
+            cursor.execute("ALTER TABLE accounts_new RENAME TO accounts")
+
+            cursor.execute(_TRANSACTIONS_TABLE.format(name="transactions_new"))
+            cursor.execute("""
+                INSERT INTO transactions_new (id, account_id, transaction_type, amount,
+                                              balance_after, description, created_at)
+                SELECT id, account_id, transaction_type, CAST(ROUND(amount * 100) AS INTEGER),
+                       CAST(ROUND(balance_after * 100) AS INTEGER), description, created_at
+                FROM transactions
+            """)
+            cursor.execute("DROP TABLE transactions")
+            cursor.execute("ALTER TABLE transactions_new RENAME TO transactions")
+
+            for name, seq in sequences:
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = ?", (name,))
+                cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (name, seq))
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
 
     def close(self):
         """Close database connection."""
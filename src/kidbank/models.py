@@ -0,0 +1,55 @@
+"""Record types for accounts and transactions."""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+class _Record:
+    """Read-only mapping-style access for record classes.
+
+    Lets code written against the old row dictionaries (``account["balance"]``,
+    ``txn.get("description")``) keep working unchanged.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the named field, or default if there is no such field."""
+        return getattr(self, key, default)
+
+
+@dataclass(frozen=True)
+class Account(_Record):
+    """A bank account."""
+
+    __slots__ = ("id", "account_number", "first_name", "last_name", "account_type",
+                 "currency", "balance", "created_at")
+
+    id: int
+    account_number: str
+    first_name: str
+    last_name: str
+    account_type: str
+    currency: str
+    balance: int
+    created_at: str
+
+
+@dataclass(frozen=True)
+class Transaction(_Record):
+    """A recorded deposit or withdrawal."""
+
+    __slots__ = ("id", "transaction_type", "amount", "balance_after", "description", "created_at")
+
+    id: int
+    transaction_type: str
+    amount: int
+    balance_after: int
+    description: str
+    created_at: str
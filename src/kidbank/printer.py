@@ -1,9 +1,37 @@
 """Printer functionality for receipts and statements."""
 
+import asyncio
 import subprocess
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import IO, Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
 from .currency import get_currency
+from .models import Account, Transaction
+
+try:
+    import cups  # type: ignore[import-not-found]
+except ImportError:  # pycups is optional; without it documents go through lp
+    cups = None
+
+# What the documents are printed from: the manager's records, or plain
+# mappings with the same keys
+AccountRecord = Union[Account, Mapping[str, Any]]
+TransactionRecord = Union[Transaction, Mapping[str, Any]]
+
+# Display format for every timestamp on printed documents
+_TS_FMT = "%m/%d/%Y %I:%M:%S %p"
+
+# Characters encoded and written to lp or CUPS at a time
+_PIPE_CHUNK = 64 * 1024
+
+# Seconds lp is given to take a job, plus one more second for every
+# _LP_CHARS_PER_SECOND of content so long statements are not cut off
+_LP_TIMEOUT = 10
+_LP_CHARS_PER_SECOND = 1024 * 1024
+
+# One row of the statement's transaction table, parsed once
+_STMT_ROW = "  {d:20s} {t:10s} {s}{a:>15s}  {b:>15s}".format
 
 
 class PrinterError(Exception):
@@ -11,11 +39,120 @@ class PrinterError(Exception):
     pass
 
 
+def _lp_timeout(content: Union[str, bytes]) -> int:
+    """Return the seconds to wait for lp to accept a document of this size."""
+    return _LP_TIMEOUT + len(content) // _LP_CHARS_PER_SECOND
+
+
+def _feed_lp(stdin: IO[bytes], content: Union[str, bytes], errors: List[BaseException]) -> None:
+    """Write a document to lp's stdin, encoding text a chunk at a time, then close it.
+
+    Runs on its own thread while the caller waits on lp. A failure other
+    than lp going away is appended to errors for the caller to raise.
+    """
+    try:
+        try:
+            if isinstance(content, bytes):
+                stdin.write(content)
+            else:
+                for start in range(0, len(content), _PIPE_CHUNK):
+                    stdin.write(content[start:start + _PIPE_CHUNK].encode("utf-8"))
+        finally:
+            # Closing sends lp end-of-file, even when a write failed
+            stdin.close()
+    except BrokenPipeError:
+        # lp exited or was killed before taking everything; its stderr or
+        # the timeout says why
+        pass
+    except BaseException as e:
+        errors.append(e)
+
+
+@lru_cache(maxsize=1024)
+def _format_datetime_cached(dt_str: str) -> str:
+    """Format a database datetime string for display, memoized per string."""
+    try:
+        # Parse the datetime string from database
+        dt = datetime.fromisoformat(dt_str.replace(" ", "T"))
+        return dt.strftime(_TS_FMT)
+    except (ValueError, TypeError):
+        return dt_str
+
+
+@lru_cache(maxsize=64)
+def _resolve_type(transaction_type: str) -> Tuple[str, str]:
+    """Return a transaction type's display name and sign, e.g. ('DEPOSIT', '+')."""
+    txn_type = transaction_type.upper()
+    return txn_type, "+" if txn_type.startswith("DEPOSIT") else "-"
+
+
 class Printer:
-    """Handles printing of receipts and statements using lp command."""
+    """Handles printing of receipts and statements through CUPS or the lp command."""
 
     WIDTH = 80  # Standard terminal width for retro aesthetic
 
+    # Connection to the CUPS server, opened on first print when pycups is
+    # available and shared by every later print. The lock serializes its use
+    # across print workers.
+    _cups_conn = None
+    _cups_lock = threading.Lock()
+
+    # Separator lines, built once rather than on every use
+    _LINE_EQ = "=" * WIDTH
+    _LINE_DASH = "-" * WIDTH
+    _LINE_STAR = "*" * WIDTH
+
+    # Fixed banners, centered once
+    _BANNER_SYSTEM = "KIDBANK TERMINAL SYSTEM".center(WIDTH)
+    _BANNER_RECEIPT = "TRANSACTION RECEIPT".center(WIDTH)
+    _BANNER_STATEMENT = "ACCOUNT STATEMENT".center(WIDTH)
+    _BANNER_DETAILED = "DETAILED ACCOUNT STATEMENT".center(WIDTH)
+    _BANNER_RECENT_TXN = "RECENT TRANSACTIONS".center(WIDTH)
+    _BANNER_TXN_DETAILS = "TRANSACTION DETAILS".center(WIDTH)
+    _BANNER_NO_TXN = "No transactions on record".center(WIDTH)
+    _BANNER_THANKS = "Thank you for banking with KIDBANK".center(WIDTH)
+
+    # Column header of the statement's transaction table
+    _STMT_HEADER = ("  DATE/TIME           TYPE          AMOUNT              BALANCE", _LINE_DASH)
+
+    # Fixed closing lines of the statements
+    _STATEMENT_FOOTER = ("", _LINE_STAR, _BANNER_THANKS, _LINE_STAR, "", "")
+    _DETAILED_FOOTER = _STATEMENT_FOOTER[1:]
+
+    # Receipt layout, defined once. The bytes copy of the fixed text, which
+    # is ASCII, is encoded here once; only the per-receipt fields are
+    # encoded per call (bytes formatting treats %s like %s).
+    _RECEIPT = "\n".join((
+        "",
+        _LINE_STAR,
+        _BANNER_SYSTEM,
+        _BANNER_RECEIPT,
+        _LINE_STAR,
+        "",
+        _LINE_DASH,
+        "  DATE/TIME: %s",
+        "  TRANSACTION ID: %s",
+        _LINE_DASH,
+        "",
+        "  ACCOUNT HOLDER: %s %s",
+        "  ACCOUNT NUMBER: %s",
+        "  ACCOUNT TYPE: %s",
+        "",
+        _LINE_DASH,
+        "  TRANSACTION TYPE: %s",
+        "  AMOUNT: %s",
+        "",
+        "  NEW BALANCE: %s",
+        _LINE_DASH,
+        "",
+        # The optional description block goes right before the footer
+        "%s" + _BANNER_THANKS,
+        _LINE_STAR,
+        "",
+        "",
+    ))
+    _RECEIPT_B = _RECEIPT.encode("ascii")
+
     @staticmethod
     def _center(text: str, width: int = WIDTH) -> str:
         """Center text within given width."""
@@ -26,235 +163,379 @@ class Printer:
         """Generate a line of characters."""
         return char * width
 
+    @staticmethod
+    def _render_row(txn: TransactionRecord, format_amount: Callable[[int], str]) -> str:
+        """Render one transaction's row of the statement table.
+
+        Args:
+            txn: Transaction record
+            format_amount: The account currency's format_amount
+
+        Returns:
+            The row, without a trailing newline
+        """
+        txn_type, sign = _resolve_type(txn["transaction_type"])
+        return _STMT_ROW(d=Printer._format_datetime(txn["created_at"]), t=txn_type[:10], s=sign,
+                         a=format_amount(txn["amount"]), b=format_amount(txn["balance_after"]))
+
+    @staticmethod
+    def _render_txn(i: int, txn: TransactionRecord, format_amount: Callable[[int], str]) -> str:
+        """Render one transaction's block of the detailed statement.
+
+        Args:
+            i: Position of the transaction on the statement, starting at 1
+            txn: Transaction record
+            format_amount: The account currency's format_amount
+
+        Returns:
+            The block's lines, each ending in a newline
+        """
+        txn_type, sign = _resolve_type(txn["transaction_type"])
+        notes = f"  Notes: {description}\n" if (description := txn.get("description")) else ""
+
+        return (
+            f"{Printer._LINE_DASH}\n"
+            f"  TRANSACTION #{i}\n"
+            f"  Date/Time: {Printer._format_datetime(txn['created_at'])}\n"
+            f"  Type: {txn_type}\n"
+            f"  Amount: {sign}{format_amount(txn['amount'])}\n"
+            f"  Balance After: {format_amount(txn['balance_after'])}\n"
+            f"{notes}"
+        )
+
     @staticmethod
     def _format_datetime(dt_str: str) -> str:
         """Format datetime string for display."""
-        try:
-            # Parse the datetime string from database
-            dt = datetime.fromisoformat(dt_str.replace(" ", "T"))
-            return dt.strftime("%m/%d/%Y %I:%M:%S %p")
-        except:
+        if not dt_str:
             return dt_str
+        return _format_datetime_cached(dt_str)
 
     @staticmethod
-    def format_receipt(account: Dict, transaction: Dict, transaction_id: int) -> str:
+    def format_receipt(account: AccountRecord, transaction: Mapping[str, Any], transaction_id: int, now: Optional[str] = None) -> str:
         """Format a transaction receipt.
 
         Args:
-            account: Account dictionary with holder info, number, balance, currency
-            transaction: Transaction dictionary with type, amount, new_balance
+            account: Account record with holder info, number, balance, currency
+            transaction: Transaction details with type, amount, new_balance
             transaction_id: ID of the transaction
+            now: Formatted print time. Defaults to the current time; pass one
+                shared value when formatting several documents together.
 
         Returns:
             Formatted receipt as string
         """
-        currency = get_currency(account["currency"])
-        now = datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")
+        return Printer._RECEIPT % Printer._receipt_fields(account, transaction, transaction_id, now)
 
-        # Get transaction details
-        txn_type = transaction["transaction_type"].upper()
-        amount = transaction["amount"]
-        new_balance = transaction["new_balance"]
-        description = transaction.get("description", "")
+    @staticmethod
+    def format_receipt_bytes(account: AccountRecord, transaction: Mapping[str, Any], transaction_id: int,
+                             now: Optional[str] = None) -> bytes:
+        """Format a transaction receipt as UTF-8 bytes, ready to send to lp.
 
-        lines = [
-            "",
-            Printer._line("*"),
-            Printer._center("KIDBANK TERMINAL SYSTEM"),
-            Printer._center("TRANSACTION RECEIPT"),
-            Printer._line("*"),
-            "",
-            Printer._line("-"),
-            f"  DATE/TIME: {now}",
-            f"  TRANSACTION ID: {transaction_id}",
-            Printer._line("-"),
-            "",
-            f"  ACCOUNT HOLDER: {account['first_name']} {account['last_name']}",
-            f"  ACCOUNT NUMBER: {account['account_number']}",
-            f"  ACCOUNT TYPE: {account['account_type'].upper()}",
-            "",
-            Printer._line("-"),
-            f"  TRANSACTION TYPE: {txn_type}",
-            f"  AMOUNT: {currency.format_amount(amount)}",
-            "",
-            f"  NEW BALANCE: {currency.format_amount(new_balance)}",
-            Printer._line("-"),
-            "",
-        ]
-
-        # Add description only if it exists
-        if description:
-            lines.extend([
-                f"  DESCRIPTION: {description}",
-                "",
-            ])
-
-        lines.extend([
-            Printer._center("Thank you for banking with KIDBANK"),
-            Printer._line("*"),
-            "",
-            "",
-        ])
+        Args:
+            account: Account record with holder info, number, balance, currency
+            transaction: Transaction details with type, amount, new_balance
+            transaction_id: ID of the transaction
+            now: Formatted print time. Defaults to the current time.
+
+        Returns:
+            Formatted receipt, UTF-8 encoded
+        """
+        fields = Printer._receipt_fields(account, transaction, transaction_id, now)
+        return Printer._RECEIPT_B % tuple(field.encode("utf-8") for field in fields)
 
-        return "\n".join(lines)
+    @staticmethod
+    def _receipt_fields(account: AccountRecord, transaction: Mapping[str, Any], transaction_id: int,
+                        now: Optional[str]) -> Tuple[str, ...]:
+        """Return the per-receipt values for the receipt template, in template order."""
+        currency = get_currency(account["currency"])
+
+        # Description block appears only if there is a description
+        if description := transaction.get("description"):
+            desc_block = f"  DESCRIPTION: {description}\n\n"
+        else:
+            desc_block = ""
+
+        return (
+            now or datetime.now().strftime(_TS_FMT),
+            str(transaction_id),
+            account["first_name"],
+            account["last_name"],
+            account["account_number"],
+            account["account_type"].upper(),
+            transaction["transaction_type"].upper(),
+            currency.format_amount(transaction["amount"]),
+            currency.format_amount(transaction["new_balance"]),
+            desc_block,
+        )
 
     @staticmethod
-    def format_statement(account: Dict, transactions: List[Dict]) -> str:
+    def format_statement(account: AccountRecord, transactions: Sequence[TransactionRecord], now: Optional[str] = None) -> str:
         """Format an account statement.
 
         Args:
-            account: Account dictionary with holder info, number, balance, currency
-            transactions: List of transaction dictionaries
+            account: Account record with holder info, number, balance, currency
+            transactions: Transaction records
+            now: Formatted statement date. Defaults to the current time.
 
         Returns:
             Formatted statement as string
         """
         currency = get_currency(account["currency"])
-        now = datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")
+        now = now or datetime.now().strftime(_TS_FMT)
 
-        lines = [
+        if not transactions:
+            body: Tuple[str, ...] = (Printer._BANNER_NO_TXN,)
+        else:
+            # Transactions, one table row each
+            fmt_amt = currency.format_amount
+            render = Printer._render_row
+            body = (*Printer._STMT_HEADER, *(render(txn, fmt_amt) for txn in transactions))
+
+        # Every piece of the statement goes through one join
+        return "\n".join((
             "",
-            Printer._line("*"),
-            Printer._center("KIDBANK TERMINAL SYSTEM"),
-            Printer._center("ACCOUNT STATEMENT"),
-            Printer._line("*"),
+            Printer._LINE_STAR,
+            Printer._BANNER_SYSTEM,
+            Printer._BANNER_STATEMENT,
+            Printer._LINE_STAR,
             "",
             f"  STATEMENT DATE: {now}",
             "",
-            Printer._line("-"),
+            Printer._LINE_DASH,
             f"  ACCOUNT HOLDER: {account['first_name']} {account['last_name']}",
             f"  ACCOUNT NUMBER: {account['account_number']}",
             f"  ACCOUNT TYPE: {account['account_type'].upper()}",
             f"  CURRENCY: {currency.name}",
             "",
             f"  CURRENT BALANCE: {currency.format_amount(account['balance'])}",
-            Printer._line("-"),
+            Printer._LINE_DASH,
             "",
-            Printer._center("RECENT TRANSACTIONS"),
+            Printer._BANNER_RECENT_TXN,
             "",
-        ]
-
-        if not transactions:
-            lines.append(Printer._center("No transactions on record"))
-        else:
-            # Header
-            lines.append("  DATE/TIME           TYPE          AMOUNT              BALANCE")
-            lines.append(Printer._line("-"))
-
-            # Transactions
-            for txn in transactions:
-                date_str = Printer._format_datetime(txn["created_at"])
-                txn_type = txn["transaction_type"].upper()[:10]
-                amount = currency.format_amount(txn["amount"])
-                balance = currency.format_amount(txn["balance_after"])
-                sign = "+" if txn_type.startswith("DEPOSIT") else "-"
-
-                # Format line with proper spacing
-                line = f"  {date_str:20s} {txn_type:10s} {sign}{amount:>15s}  {balance:>15s}"
-                lines.append(line)
-
-        lines.extend([
-            "",
-            Printer._line("*"),
-            Printer._center("Thank you for banking with KIDBANK"),
-            Printer._line("*"),
-            "",
-            "",
-        ])
-
-        return "\n".join(lines)
+            *body,
+            *Printer._STATEMENT_FOOTER,
+        ))
 
     @staticmethod
-    def format_detailed_statement(account: Dict, transactions: List[Dict]) -> str:
+    def format_detailed_statement(account: AccountRecord, transactions: Sequence[TransactionRecord], now: Optional[str] = None) -> str:
         """Format a detailed account statement with transaction notes.
 
         Args:
-            account: Account dictionary with holder info, number, balance, currency
-            transactions: List of transaction dictionaries
+            account: Account record with holder info, number, balance, currency
+            transactions: Transaction records
+            now: Formatted statement date. Defaults to the current time.
 
         Returns:
             Formatted detailed statement as string
         """
         currency = get_currency(account["currency"])
-        now = datetime.now().strftime("%m/%d/%Y %I:%M:%S %p")
+        now = now or datetime.now().strftime(_TS_FMT)
 
-        lines = [
+        if not transactions:
+            body: Tuple[str, ...] = (Printer._BANNER_NO_TXN,)
+        else:
+            # Show each transaction with full details, one block per transaction
+            fmt_amt = currency.format_amount
+            render = Printer._render_txn
+            body = tuple(render(i, txn, fmt_amt) for i, txn in enumerate(transactions, 1))
+
+        # Every piece of the statement goes through one join
+        return "\n".join((
             "",
-            Printer._line("*"),
-            Printer._center("KIDBANK TERMINAL SYSTEM"),
-            Printer._center("DETAILED ACCOUNT STATEMENT"),
-            Printer._line("*"),
+            Printer._LINE_STAR,
+            Printer._BANNER_SYSTEM,
+            Printer._BANNER_DETAILED,
+            Printer._LINE_STAR,
             "",
             f"  STATEMENT DATE: {now}",
             "",
-            Printer._line("-"),
+            Printer._LINE_DASH,
             f"  ACCOUNT HOLDER: {account['first_name']} {account['last_name']}",
             f"  ACCOUNT NUMBER: {account['account_number']}",
             f"  ACCOUNT TYPE: {account['account_type'].upper()}",
             f"  CURRENCY: {currency.name}",
             "",
             f"  CURRENT BALANCE: {currency.format_amount(account['balance'])}",
-            Printer._line("-"),
+            Printer._LINE_DASH,
             "",
-            Printer._center("TRANSACTION DETAILS"),
+            Printer._BANNER_TXN_DETAILS,
             "",
-        ]
+            *body,
+            *Printer._DETAILED_FOOTER,
+        ))
 
-        if not transactions:
-            lines.append(Printer._center("No transactions on record"))
+    @classmethod
+    def print_document(cls, content: Union[str, bytes]) -> None:
+        """Send document to the default printer.
+
+        Uses the CUPS server directly when pycups is installed, and the lp
+        command otherwise.
+
+        Args:
+            content: Text content to print, or content already encoded as UTF-8
+
+        Raises:
+            PrinterError: If printing fails
+        """
+        if cups is not None:
+            cls._send_to_cups(content)
         else:
-            # Show each transaction with full details
-            for i, txn in enumerate(transactions, 1):
-                date_str = Printer._format_datetime(txn["created_at"])
-                txn_type = txn["transaction_type"].upper()
-                amount = currency.format_amount(txn["amount"])
-                balance = currency.format_amount(txn["balance_after"])
-                sign = "+" if txn_type.startswith("DEPOSIT") else "-"
-                description = txn.get("description", "")
-
-                lines.append(Printer._line("-"))
-                lines.append(f"  TRANSACTION #{i}")
-                lines.append(f"  Date/Time: {date_str}")
-                lines.append(f"  Type: {txn_type}")
-                lines.append(f"  Amount: {sign}{amount}")
-                lines.append(f"  Balance After: {balance}")
-
-                if description:
-                    lines.append(f"  Notes: {description}")
-
-                lines.append("")
-
-        lines.extend([
-            Printer._line("*"),
-            Printer._center("Thank you for banking with KIDBANK"),
-            Printer._line("*"),
-            "",
-            "",
-        ])
+            cls._send_to_lp(content)
 
-        return "\n".join(lines)
+    @classmethod
+    def print_documents(cls, contents: List[str]) -> None:
+        """Send several documents to the default printer as one lp job.
 
-    @staticmethod
-    def print_document(content: str) -> None:
-        """Send document to default printer using lp command.
+        The documents are separated by form feeds, so each starts on a new
+        page, and the lp process is started once for the whole batch.
+
+        Args:
+            contents: Text content of each document to print
+
+        Raises:
+            PrinterError: If printing fails
+        """
+        if contents:
+            cls.print_document("\x0c".join(contents))
+
+    @classmethod
+    async def print_document_async(cls, content: Union[str, bytes]) -> None:
+        """Send document to the default printer without blocking the event loop.
+
+        Args:
+            content: Text content to print, or content already encoded as UTF-8
+
+        Raises:
+            PrinterError: If printing fails
+        """
+        if cups is not None:
+            await asyncio.get_running_loop().run_in_executor(None, cls._send_to_cups, content)
+        else:
+            await cls._send_to_lp_async(content)
+
+    @classmethod
+    async def print_many_async(cls, contents: List[Union[str, bytes]]) -> None:
+        """Send several documents to the default printer as separate, overlapping jobs.
+
+        Every submission runs to completion before an error is raised, so a
+        failed job never leaves others unfinished.
 
         Args:
-            content: Text content to print
+            contents: Content of each document to print
+
+        Raises:
+            PrinterError: If any document fails to print; the first failure is raised
+        """
+        results = await asyncio.gather(*(cls.print_document_async(c) for c in contents),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    @staticmethod
+    async def _send_to_lp_async(content: Union[str, bytes]) -> None:
+        """Write a document to an lp subprocess started from the event loop.
+
+        Raises:
+            PrinterError: If printing fails
+        """
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "lp", stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE)
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(data), timeout=_lp_timeout(data))
+            except BaseException:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+
+            if proc.returncode != 0:
+                error_msg = stderr.decode("utf-8").strip()
+                raise PrinterError(f"Print failed: {error_msg}")
+
+        except asyncio.TimeoutError:
+            raise PrinterError("Print command timed out")
+        except FileNotFoundError:
+            raise PrinterError("lp command not found. Ensure CUPS is installed.")
+        except Exception as e:
+            raise PrinterError(f"Print error: {str(e)}")
+
+    @classmethod
+    def _send_to_cups(cls, content: Union[str, bytes]) -> None:
+        """Submit a document to the default CUPS printer over a shared connection.
+
+        Text is encoded and written a chunk at a time, as for lp. A failed
+        print drops the connection so the next print opens a fresh one.
+
+        Raises:
+            PrinterError: If printing fails
+        """
+        with cls._cups_lock:
+            try:
+                if cls._cups_conn is None:
+                    cls._cups_conn = cups.Connection()
+                conn = cls._cups_conn
+
+                printer = conn.getDefault()
+                if not printer:
+                    raise PrinterError("No default printer is configured")
+
+                job_id = conn.createJob(printer, "kidbank", {})
+                conn.startDocument(printer, job_id, "kidbank", cups.CUPS_FORMAT_TEXT, 1)
+                if isinstance(content, bytes):
+                    conn.writeRequestData(content, len(content))
+                else:
+                    for start in range(0, len(content), _PIPE_CHUNK):
+                        chunk = content[start:start + _PIPE_CHUNK].encode("utf-8")
+                        conn.writeRequestData(chunk, len(chunk))
+                conn.finishDocument(printer)
+
+            except PrinterError:
+                raise
+            except Exception as e:
+                cls._cups_conn = None
+                raise PrinterError(f"Print error: {str(e)}")
+
+    @staticmethod
+    def _send_to_lp(content: Union[str, bytes]) -> None:
+        """Stream a document to the lp command.
+
+        Text is encoded and written a chunk at a time, so a large document is
+        never held in memory a second time as one bytes object. Bytes are
+        written as-is. The writes happen on a helper thread while this one
+        waits on lp, so the timeout covers writing too, and lp's error
+        message is still read if it exits before taking all the input.
 
         Raises:
             PrinterError: If printing fails
         """
         try:
             # Use lp command to print to default printer
-            result = subprocess.run(
-                ["lp"],
-                input=content.encode("utf-8"),
-                capture_output=True,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr.decode("utf-8").strip()
+            # lp's job-id message on stdout is not needed, so only stderr
+            # gets a pipe, and it is only decoded when lp fails
+            with subprocess.Popen(["lp"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.PIPE) as proc:
+                # stdin is handed to the writer, so communicate() only reads stderr
+                stdin, proc.stdin = proc.stdin, None
+                errors: List[BaseException] = []
+                writer = threading.Thread(target=_feed_lp, args=(stdin, content, errors), daemon=True)
+                writer.start()
+                try:
+                    _, stderr = proc.communicate(timeout=_lp_timeout(content))
+                except BaseException:
+                    # Killing lp also breaks the pipe, releasing a blocked writer
+                    proc.kill()
+                    raise
+                finally:
+                    writer.join()
+                if errors:
+                    raise errors[0]
+
+            if proc.returncode != 0:
+                error_msg = stderr.decode("utf-8").strip()
                 raise PrinterError(f"Print failed: {error_msg}")
 
         except subprocess.TimeoutExpired:
@@ -265,27 +546,27 @@ class Printer:
             raise PrinterError(f"Print error: {str(e)}")
 
     @classmethod
-    def print_receipt(cls, account: Dict, transaction: Dict, transaction_id: int) -> None:
+    def print_receipt(cls, account: AccountRecord, transaction: Mapping[str, Any], transaction_id: int) -> None:
         """Print a transaction receipt.
 
         Args:
-            account: Account dictionary
-            transaction: Transaction dictionary
+            account: Account record
+            transaction: Transaction details
             transaction_id: Transaction ID
 
         Raises:
             PrinterError: If printing fails
         """
-        content = cls.format_receipt(account, transaction, transaction_id)
+        content = cls.format_receipt_bytes(account, transaction, transaction_id)
         cls.print_document(content)
 
     @classmethod
-    def print_statement(cls, account: Dict, transactions: List[Dict]) -> None:
+    def print_statement(cls, account: AccountRecord, transactions: Sequence[TransactionRecord]) -> None:
         """Print an account statement.
 
         Args:
-            account: Account dictionary
-            transactions: List of transaction dictionaries
+            account: Account record
+            transactions: Transaction records
 
         Raises:
             PrinterError: If printing fails
@@ -294,12 +575,12 @@ class Printer:
         cls.print_document(content)
 
     @classmethod
-    def print_detailed_statement(cls, account: Dict, transactions: List[Dict]) -> None:
+    def print_detailed_statement(cls, account: AccountRecord, transactions: Sequence[TransactionRecord]) -> None:
         """Print a detailed account statement with transaction notes.
 
         Args:
-            account: Account dictionary
-            transactions: List of transaction dictionaries
+            account: Account record
+            transactions: Transaction records
 
         Raises:
             PrinterError: If printing fails
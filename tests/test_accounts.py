@@ -0,0 +1,324 @@
+"""Tests for account management."""
+
+import pytest
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+from src.kidbank.database import Database
+from src.kidbank.accounts import AccountManager, MAX_CENTS
+from src.kidbank.models import Account
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Account manager backed by a throwaway database."""
+    db = Database(tmp_path / "kidbank.db")
+    yield AccountManager(db)
+    db.close()
+
+
+class TestRecords:
+    """Test the account and transaction records."""
+
+    def test_mapping_access(self, manager):
+        """Test that records support the dict-style access used by the UI and printer."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        txn = manager.get_transactions(a.account_number)[0]
+
+        assert isinstance(a, Account)
+        assert a["first_name"] == a.first_name == "Ann"
+        assert txn["amount"] == txn.amount == 1000
+        assert txn.get("description", "") == "Initial deposit"
+        assert txn.get("missing", "x") == "x"
+        with pytest.raises(KeyError):
+            a["missing"]
+
+
+class TestCreateAccount:
+    """Test account creation."""
+
+    @patch("src.kidbank.accounts.random.randint", side_effect=[111111, 111111, 222222])
+    def test_account_number_collision_retries(self, mock_randint, manager):
+        """Test that a taken account number is retried."""
+        first = manager.create_account("Ann", "Lee", "checking", "USD")
+        second = manager.create_account("Bob", "Lee", "checking", "USD")
+
+        assert first["account_number"] == "111111"
+        assert second["account_number"] == "222222"
+        assert mock_randint.call_count == 3
+
+    def test_create_account_many(self, manager):
+        """Test creating several accounts in one batch."""
+        accounts = manager.create_account_many([
+            {"first_name": " Ann ", "last_name": "Lee", "account_type": "checking", "currency": "USD",
+             "initial_deposit": 500},
+            {"first_name": "Bob", "last_name": "Lee", "account_type": "savings", "currency": "BB"},
+        ])
+
+        assert [a["first_name"] for a in accounts] == ["Ann", "Bob"]
+        assert len({a["account_number"] for a in accounts}) == 2
+        assert accounts[0]["balance"] == 500
+        assert len(manager.get_transactions(accounts[0]["account_number"])) == 1
+        assert manager.get_transactions(accounts[1]["account_number"]) == []
+
+    def test_create_account_many_validates_every_record(self, manager):
+        """Test that one bad record stops the whole batch."""
+        with pytest.raises(ValueError, match="Account type"):
+            manager.create_account_many([
+                {"first_name": "Ann", "last_name": "Lee", "account_type": "checking", "currency": "USD"},
+                {"first_name": "Bob", "last_name": "Lee", "account_type": "loan", "currency": "USD"},
+            ])
+
+        assert manager.list_accounts() == []
+
+    def test_generate_account_numbers_skips_taken(self, manager):
+        """Test that generated numbers avoid existing accounts."""
+        taken = manager.create_account("Ann", "Lee", "checking", "USD")["account_number"]
+
+        with patch("src.kidbank.accounts.random.sample", return_value=[int(taken), 222222, 333333]):
+            assert manager.generate_account_numbers(2) == ["222222", "333333"]
+
+
+class TestBatchTransactions:
+    """Test batched deposits and withdrawals."""
+
+    def test_deposit_many(self, manager):
+        """Test deposits across several accounts in one batch."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        b = manager.create_account("Bob", "Lee", "savings", "BB", 0)
+
+        results = manager.deposit_many([
+            (a["account_number"], 500, "Allowance"),
+            (b["account_number"], 200, ""),
+            (a["account_number"], 100, "Chores"),
+        ])
+
+        assert [r["new_balance"] for r in results] == [1500, 200, 1600]
+        assert results[1]["description"] == "Deposit"
+        assert manager.get_account(a["account_number"])["balance"] == 1600
+        assert manager.get_account(b["account_number"])["balance"] == 200
+
+        ids = [r["transaction_id"] for r in results]
+        assert ids == sorted(set(ids))
+        recorded = {t["id"] for t in manager.get_transactions(a["account_number"])}
+        assert {ids[0], ids[2]} <= recorded
+
+    def test_withdraw_many_insufficient_funds_rolls_back(self, manager):
+        """Test that a failing withdrawal leaves the whole batch unapplied."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+
+        with pytest.raises(ValueError, match="Insufficient funds"):
+            manager.withdraw_many([
+                (a["account_number"], 600, ""),
+                (a["account_number"], 600, ""),
+            ])
+
+        assert manager.get_account(a["account_number"])["balance"] == 1000
+        assert len(manager.get_transactions(a["account_number"])) == 1
+
+    def test_deposit_unknown_account(self, manager):
+        """Test deposit to a missing account."""
+        with pytest.raises(ValueError, match="not found"):
+            manager.deposit("000000", 100)
+
+    def test_concurrent_managers_do_not_lose_updates(self, manager, tmp_path):
+        """Test that balances are updated in SQL rather than from a stale read."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        other_db = Database(tmp_path / "kidbank.db")
+        other = AccountManager(other_db)
+
+        other.deposit(a["account_number"], 500)
+        result = manager.deposit(a["account_number"], 100)
+        other_db.close()
+
+        assert result["new_balance"] == 1600
+
+    def test_repeated_deposits_are_exact(self, manager):
+        """Test that balances do not pick up floating point drift."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD")
+
+        manager.deposit_many([(a["account_number"], 10, "")] * 10)
+
+        assert manager.get_account(a["account_number"])["balance"] == 100
+
+    def test_amounts_must_be_int_cents(self, manager):
+        """Test that fractional cents and oversized amounts are rejected before reaching SQLite."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+
+        with pytest.raises(ValueError, match="whole number of cents"):
+            manager.deposit(a.account_number, 1.5)
+        with pytest.raises(ValueError, match="too large"):
+            manager.deposit(a.account_number, MAX_CENTS + 1)
+        with pytest.raises(ValueError, match="Initial deposit"):
+            manager.create_account("Bob", "Lee", "checking", "USD", 2.5)
+
+        assert manager.get_account(a.account_number).balance == 1000
+
+    def test_balance_cannot_overflow(self, manager):
+        """Test that a deposit pushing the balance past MAX_CENTS is rolled back."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", MAX_CENTS - 10)
+
+        with pytest.raises(ValueError, match="exceed the maximum"):
+            manager.deposit(a.account_number, 50)
+        with pytest.raises(ValueError, match="exceed the maximum"):
+            manager.deposit_many([(a.account_number, MAX_CENTS, "")] * 2)
+
+        manager.invalidate()
+        balance = manager.get_account(a.account_number).balance
+        assert balance == MAX_CENTS - 10
+        assert isinstance(balance, int)
+
+    def test_batches_split_at_the_parameter_limit(self, manager):
+        """Test that batches larger than one statement can bind are split but stay atomic."""
+        manager.db.max_variables = 12
+        accounts = manager.create_account_many([
+            {"first_name": f"Kid{i}", "last_name": "Lee", "account_type": "checking", "currency": "USD",
+             "initial_deposit": 100}
+            for i in range(5)
+        ])
+        numbers = [a.account_number for a in accounts]
+
+        manager.deposit_many([(n, 50, "") for n in numbers])
+        with pytest.raises(ValueError, match="Insufficient funds"):
+            manager.withdraw_many([(n, 150 if i < 4 else 151, "") for i, n in enumerate(numbers)])
+
+        manager.invalidate()
+        assert [manager.get_account(n).balance for n in numbers] == [150] * 5
+        assert all(len(manager.get_transactions(n)) == 2 for n in numbers)
+
+    def test_single_withdraw(self, manager):
+        """Test single withdrawal goes through the batch path."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+
+        result = manager.withdraw(a["account_number"], 400, "Candy")
+
+        assert result["transaction_type"] == "withdrawal"
+        assert result["new_balance"] == 600
+        assert result["transaction_id"] == max(t["id"] for t in manager.get_transactions(a["account_number"]))
+
+
+class TestAccountCache:
+    """Test the in-process account cache."""
+
+    def test_cache_is_written_through(self, manager):
+        """Test that cached accounts see balance changes and external edits after invalidate."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        number = a["account_number"]
+
+        manager.deposit(number, 500)
+        assert manager.get_account(number)["balance"] == 1500
+
+        manager.db.execute("UPDATE accounts SET first_name = 'Annie' WHERE account_number = ?", (number,))
+        assert manager.get_account(number)["first_name"] == "Ann"
+
+        manager.invalidate(number)
+        assert manager.get_account(number)["first_name"] == "Annie"
+
+    def test_cached_accounts_are_immutable(self, manager):
+        """Test that callers cannot mutate the cached account."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+
+        with pytest.raises(FrozenInstanceError):
+            manager.get_account(a.account_number).balance = 0
+
+        assert manager.get_account(a.account_number).balance == 1000
+
+    def test_listings_are_cached_until_a_write(self, manager):
+        """Test that repeated listings are served from cache and refreshed after writes."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        manager.get_transactions(a.account_number)
+        manager.list_account_summaries()
+
+        with patch.object(manager, "iter_transactions") as mock_iter:
+            assert len(manager.get_transactions(a.account_number)) == 1
+        mock_iter.assert_not_called()
+
+        manager.deposit(a.account_number, 500)
+
+        assert len(manager.get_transactions(a.account_number)) == 2
+        assert manager.list_account_summaries()[0][-1] == 1500
+
+
+class TestListing:
+    """Test account and transaction listings."""
+
+    def test_iter_accounts_in_batches(self, manager):
+        """Test that iterating in small batches returns every account in name order."""
+        for first, last in [("Cat", "Zed"), ("Ann", "Lee"), ("Bob", "Lee")]:
+            manager.create_account(first, last, "checking", "USD")
+
+        names = [(a["first_name"], a["last_name"]) for a in manager.iter_accounts(batch=2)]
+
+        assert names == [("Ann", "Lee"), ("Bob", "Lee"), ("Cat", "Zed")]
+        assert len(manager.list_accounts()) == 3
+
+    def test_list_account_summaries(self, manager):
+        """Test that summaries are plain tuples of the listed columns."""
+        a = manager.create_account("Ann", "Lee", "savings", "BB", 250)
+
+        assert manager.list_account_summaries() == [(a.account_number, "Ann", "Lee", "savings", "BB", 250)]
+
+    def test_iter_transactions_unbounded(self, manager):
+        """Test that a None limit returns the full history."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 100)
+        manager.deposit_many([(a["account_number"], 100, "")] * 12)
+
+        assert len(list(manager.iter_transactions(a["account_number"], batch=5))) == 13
+        assert len(manager.get_transactions(a["account_number"])) == 10
+
+    def test_list_transaction_summaries(self, manager):
+        """Test display-ready transaction tuples, newest first even within one second."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        manager.withdraw(a.account_number, 300)
+        manager.deposit(a.account_number, 50)
+
+        rows = manager.list_transaction_summaries(a.account_number)
+
+        assert [row[1:] for row in rows] == [
+            ("DEPOSIT", "+", 50, 750),
+            ("WITHDRAWAL", "-", 300, 700),
+            ("DEPOSIT", "+", 1000, 1000),
+        ]
+        assert len(rows[0][0]) == 19
+
+    def test_transactions_for_unknown_account(self, manager):
+        """Test that an unknown account has no transactions."""
+        assert manager.get_transactions("000000") == []
+
+
+class TestUnitOfWork:
+    """Test grouping operations into one transaction."""
+
+    def test_transfer(self, manager):
+        """Test that a transfer moves money between accounts."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        b = manager.create_account("Bob", "Lee", "savings", "USD")
+
+        withdrawal, deposit = manager.transfer(a.account_number, b.account_number, 400)
+
+        assert withdrawal["new_balance"] == 600
+        assert deposit["new_balance"] == 400
+        assert deposit["description"] == f"Transfer from {a.account_number}"
+
+    def test_failed_transfer_changes_nothing(self, manager):
+        """Test that a transfer to a missing account rolls back the withdrawal."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+
+        with pytest.raises(ValueError, match="not found"):
+            manager.transfer(a.account_number, "000000", 400)
+
+        assert manager.get_account(a.account_number).balance == 1000
+        assert len(manager.get_transactions(a.account_number)) == 1
+
+    def test_caught_failure_keeps_earlier_work(self, manager):
+        """Test that a failed operation inside a unit of work only undoes itself."""
+        a = manager.create_account("Ann", "Lee", "checking", "USD", 1000)
+        b = manager.create_account("Bob", "Lee", "checking", "USD", 100)
+
+        with manager.unit_of_work():
+            manager.deposit(a.account_number, 500)
+            with pytest.raises(ValueError, match="Insufficient funds"):
+                manager.withdraw_many([(a.account_number, 100, ""), (b.account_number, 200, "")])
+
+        manager.invalidate()
+        assert manager.get_account(a.account_number).balance == 1500
+        assert manager.get_account(b.account_number).balance == 100
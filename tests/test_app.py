@@ -0,0 +1,25 @@
+"""Tests for the terminal UI helpers."""
+
+import pytest
+from src.kidbank.app import _parse_cents
+
+
+class TestParseCents:
+    """Test parsing typed amounts into cents."""
+
+    def test_parses_amounts_exactly(self):
+        """Test amounts that floats cannot represent exactly."""
+        assert _parse_cents("0.29") == 29
+        assert _parse_cents("1234.5") == 123450
+        assert _parse_cents("10") == 1000
+
+    def test_rounds_half_to_even(self):
+        """Test that fractions of a cent round half-to-even."""
+        assert _parse_cents("0.125") == 12
+        assert _parse_cents("0.135") == 14
+
+    @pytest.mark.parametrize("text", ["abc", "1.2.3", "NaN", "Infinity", "99999999999999999999", "1e20", "1e999999"])
+    def test_rejects_invalid_amounts(self, text):
+        """Test that non-numeric or unstorably large input raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid amount"):
+            _parse_cents(text)
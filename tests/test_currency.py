@@ -0,0 +1,27 @@
+"""Tests for currency formatting."""
+
+from src.kidbank.currency import get_currency
+
+
+class TestFormatAmount:
+    """Test formatting of integer cent amounts."""
+
+    def test_prefix_and_suffix_symbols(self):
+        """Test that USD puts the symbol first and other currencies put it last."""
+        assert get_currency("USD").format_amount(100050) == "$1,000.50"
+        assert get_currency("BB").format_amount(100050) == "1,000.50 BB"
+
+    def test_small_and_negative_amounts(self):
+        """Test amounts under a dollar and below zero."""
+        usd = get_currency("USD")
+
+        assert usd.format_amount(0) == "$0.00"
+        assert usd.format_amount(5) == "$0.05"
+        assert usd.format_amount(-123456) == "$-1,234.56"
+
+    def test_format_amounts_matches_format_amount(self):
+        """Test that batch formatting gives the same strings as one at a time."""
+        amounts = [0, 5, 100050, -123456]
+        for code in ("USD", "BB"):
+            currency = get_currency(code)
+            assert currency.format_amounts(amounts) == [currency.format_amount(a) for a in amounts]
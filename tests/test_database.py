@@ -0,0 +1,146 @@
+"""Tests for database schema management."""
+
+import sqlite3
+import pytest
+from unittest.mock import patch
+from src.kidbank.database import Database, SCHEMA_VERSION
+from src.kidbank.accounts import AccountManager
+
+# Tables as released before money moved to integer cents
+_LEGACY_REAL_SCHEMA = """
+    CREATE TABLE accounts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        account_number TEXT UNIQUE NOT NULL,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        account_type TEXT NOT NULL,
+        currency TEXT NOT NULL DEFAULT 'USD',
+        balance REAL NOT NULL DEFAULT 0.0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        account_id INTEGER NOT NULL,
+        transaction_type TEXT NOT NULL,
+        amount REAL NOT NULL,
+        balance_after REAL NOT NULL,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (account_id) REFERENCES accounts (id)
+    );
+"""
+
+
+class TestSchemaVersion:
+    """Test that schema setup only runs when the database is out of date."""
+
+    def test_schema_runs_once(self, tmp_path):
+        """Test that reopening an up-to-date database skips the DDL."""
+        path = tmp_path / "kidbank.db"
+        db = Database(path)
+        assert db.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        db.close()
+
+        with patch.object(Database, "_initialize_schema") as mock_init:
+            Database(path).connect()
+
+        mock_init.assert_not_called()
+
+    def test_missing_columns_are_added(self, tmp_path):
+        """Test that a table from before names and currencies gains those columns."""
+        path = tmp_path / "kidbank.db"
+        legacy = sqlite3.connect(path)
+        legacy.execute("""
+            CREATE TABLE accounts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account_number TEXT UNIQUE NOT NULL,
+                account_type TEXT NOT NULL,
+                balance INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        legacy.close()
+
+        db = Database(path)
+        columns = {row["name"] for row in db.execute("SELECT name FROM pragma_table_info('accounts')")}
+        db.close()
+
+        assert {"first_name", "last_name", "currency"} <= columns
+
+    def test_old_sqlite_is_refused(self, tmp_path):
+        """Test that connecting fails clearly when SQLite lacks RETURNING."""
+        with patch("sqlite3.sqlite_version_info", (3, 31, 1)):
+            with pytest.raises(RuntimeError, match="SQLite 3.35.0 or newer"):
+                Database(tmp_path / "kidbank.db").connect()
+
+
+class TestCentsMigration:
+    """Test conversion of legacy REAL money columns to integer cents."""
+
+    def test_legacy_real_columns_are_converted(self, tmp_path):
+        """Test that a database with REAL balances is rebuilt in cents."""
+        path = tmp_path / "kidbank.db"
+        legacy = sqlite3.connect(path)
+        legacy.executescript(_LEGACY_REAL_SCHEMA + """
+            INSERT INTO accounts (account_number, first_name, last_name, account_type, balance)
+            VALUES ('123456', 'Ann', 'Lee', 'checking', 12.34);
+            INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
+            VALUES (1, 'deposit', 12.34, 12.34, 'Initial deposit');
+        """)
+        legacy.close()
+
+        db = Database(path)
+        manager = AccountManager(db)
+
+        stored = db.execute("SELECT balance FROM accounts").fetchone()["balance"]
+        assert stored == 1234
+        assert isinstance(stored, int)
+        assert manager.get_account("123456")["balance"] == 1234
+        assert manager.get_transactions("123456")[0]["amount"] == 1234
+
+        # New rows continue the old id sequence
+        assert manager.deposit("123456", 100)["transaction_id"] == 2
+        db.close()
+
+    def test_deleted_ids_are_not_reused(self, tmp_path):
+        """Test that the AUTOINCREMENT high-water mark survives the rebuild."""
+        path = tmp_path / "kidbank.db"
+        legacy = sqlite3.connect(path)
+        legacy.executescript(_LEGACY_REAL_SCHEMA + """
+            INSERT INTO accounts (account_number, first_name, last_name, account_type, balance)
+            VALUES ('123456', 'Ann', 'Lee', 'checking', 12.34);
+            INSERT INTO transactions (account_id, transaction_type, amount, balance_after, description)
+            VALUES (1, 'deposit', 12.34, 12.34, 'Initial deposit'),
+                   (1, 'deposit', 1.00, 13.34, 'Gift');
+            DELETE FROM transactions WHERE id = 2;
+        """)
+        legacy.close()
+
+        db = Database(path)
+        manager = AccountManager(db)
+
+        assert manager.deposit("123456", 100)["transaction_id"] == 3
+        db.close()
+
+
+class TestTransaction:
+    """Test the write transaction context manager."""
+
+    def test_nested_failure_rolls_back_only_inner_block(self, tmp_path):
+        """Test that a nested block runs under a savepoint and the outer block still commits."""
+        db = Database(tmp_path / "kidbank.db")
+        insert = "INSERT INTO accounts (account_number, first_name, last_name, account_type) VALUES (?, 'A', 'B', 'checking')"
+
+        with db.transaction() as cursor:
+            cursor.execute(insert, ("111111",))
+            try:
+                with db.transaction() as inner:
+                    inner.execute(insert, ("222222",))
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+
+        numbers = [row[0] for row in db.execute("SELECT account_number FROM accounts")]
+        assert numbers == ["111111"]
+        assert not db.conn.in_transaction
+        db.close()
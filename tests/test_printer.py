@@ -1,10 +1,36 @@
 """Tests for printer functionality."""
 
+import asyncio
+import os
 import pytest
-from unittest.mock import patch, MagicMock
+import subprocess
+from unittest.mock import AsyncMock, MagicMock, patch
 from src.kidbank.printer import Printer, PrinterError
 
 
+def _mock_lp(mock_popen, returncode=0, stderr=b""):
+    """Configure a patched Popen to act as an lp process and return it."""
+    proc = mock_popen.return_value.__enter__.return_value
+    proc.returncode = returncode
+    proc.communicate.return_value = (None, stderr)
+    # Printer detaches stdin from the process, so keep a handle on it
+    proc.lp_stdin = proc.stdin
+    return proc
+
+
+def _written(proc):
+    """Return everything written to a mocked process's stdin."""
+    return b"".join(call.args[0] for call in proc.lp_stdin.write.call_args_list)
+
+
+def _fake_lp(tmp_path, monkeypatch, script):
+    """Put an lp shell script first on PATH."""
+    lp = tmp_path / "lp"
+    lp.write_text("#!/bin/sh\n" + script + "\n")
+    lp.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
 class TestPrinterFormatting:
     """Test receipt and statement formatting."""
 
@@ -16,13 +42,13 @@ class TestPrinterFormatting:
             "account_number": "123456",
             "account_type": "checking",
             "currency": "USD",
-            "balance": 1000.00
+            "balance": 100000
         }
 
         transaction = {
             "transaction_type": "deposit",
-            "amount": 100.00,
-            "new_balance": 1000.00,
+            "amount": 10000,
+            "new_balance": 100000,
             "description": "Test deposit"
         }
 
@@ -38,6 +64,28 @@ class TestPrinterFormatting:
         assert "Test deposit" in receipt
         assert "TRANSACTION ID: 42" in receipt
 
+    def test_format_receipt_bytes(self):
+        """Test that the bytes receipt carries non-ASCII and literal percent text intact."""
+        account = {
+            "first_name": "Zoë",
+            "last_name": "Doe",
+            "account_number": "123456",
+            "account_type": "savings",
+            "currency": "BB",
+            "balance": 100
+        }
+        transaction = {"transaction_type": "withdrawal", "amount": 50, "new_balance": 100,
+                       "description": "100% fun"}
+
+        receipt = Printer.format_receipt_bytes(account, transaction, 7, now="01/02/2025 03:04:05 AM")
+
+        assert isinstance(receipt, bytes)
+        assert receipt.decode("utf-8") == Printer.format_receipt(account, transaction, 7,
+                                                                 now="01/02/2025 03:04:05 AM")
+        assert "ACCOUNT HOLDER: Zoë Doe".encode("utf-8") in receipt
+        assert b"DESCRIPTION: 100% fun" in receipt
+        assert b"AMOUNT: 0.50 BB" in receipt
+
     def test_format_statement(self):
         """Test statement formatting."""
         account = {
@@ -46,20 +94,20 @@ class TestPrinterFormatting:
             "account_number": "789012",
             "account_type": "savings",
             "currency": "USD",
-            "balance": 5000.50
+            "balance": 500050
         }
 
         transactions = [
             {
                 "transaction_type": "deposit",
-                "amount": 1000.00,
-                "balance_after": 5000.50,
+                "amount": 100000,
+                "balance_after": 500050,
                 "created_at": "2025-10-28 10:00:00"
             },
             {
                 "transaction_type": "withdrawal",
-                "amount": 200.00,
-                "balance_after": 4000.50,
+                "amount": 20000,
+                "balance_after": 400050,
                 "created_at": "2025-10-27 15:30:00"
             }
         ]
@@ -84,7 +132,7 @@ class TestPrinterFormatting:
             "account_number": "000000",
             "account_type": "checking",
             "currency": "USD",
-            "balance": 0.00
+            "balance": 0
         }
 
         statement = Printer.format_statement(account, [])
@@ -93,35 +141,133 @@ class TestPrinterFormatting:
         assert "Empty Account" in statement
         assert "No transactions on record" in statement
 
+    def test_format_statement_with_shared_time(self):
+        """Test that a caller-supplied print time is used as the statement date."""
+        account = {
+            "first_name": "Empty",
+            "last_name": "Account",
+            "account_number": "000000",
+            "account_type": "checking",
+            "currency": "USD",
+            "balance": 0
+        }
+
+        statement = Printer.format_statement(account, [], now="01/02/2025 03:04:05 AM")
+
+        assert "STATEMENT DATE: 01/02/2025 03:04:05 AM" in statement
+
+    def test_format_datetime(self):
+        """Test timestamp formatting, including values that cannot be parsed."""
+        assert Printer._format_datetime("2025-10-28 15:30:00") == "10/28/2025 03:30:00 PM"
+        assert Printer._format_datetime("not a date") == "not a date"
+        assert Printer._format_datetime("") == ""
+        assert Printer._format_datetime(None) is None
+
 
 class TestPrinterPrinting:
     """Test actual printing functionality."""
 
-    @patch('subprocess.run')
-    def test_print_document_success(self, mock_run):
+    @pytest.fixture(autouse=True)
+    def without_pycups(self):
+        """Run these tests against the lp path, as when pycups is not installed."""
+        with patch("src.kidbank.printer.cups", None):
+            yield
+
+    @patch('subprocess.Popen')
+    def test_print_document_success(self, mock_popen):
         """Test successful print."""
-        mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+        proc = _mock_lp(mock_popen)
 
         # Should not raise
         Printer.print_document("Test content")
 
-        mock_run.assert_called_once()
-        assert mock_run.call_args[0][0] == ["lp"]
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args[0][0] == ["lp"]
+        assert mock_popen.call_args[1]["stdout"] == subprocess.DEVNULL
+        assert _written(proc) == b"Test content"
 
-    @patch('subprocess.run')
-    def test_print_document_failure(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_print_document_failure(self, mock_popen):
         """Test print failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr=b"Printer error")
+        _mock_lp(mock_popen, returncode=1, stderr=b"Printer error")
 
         with pytest.raises(PrinterError) as exc_info:
             Printer.print_document("Test content")
 
         assert "Print failed: Printer error" in str(exc_info.value)
 
-    @patch('subprocess.run')
-    def test_print_receipt(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_print_documents_single_job(self, mock_popen):
+        """Test that a batch of documents is sent as one lp job split by form feeds."""
+        proc = _mock_lp(mock_popen)
+
+        Printer.print_documents(["first", "second"])
+
+        mock_popen.assert_called_once()
+        assert _written(proc) == b"first\x0csecond"
+
+    @patch('subprocess.Popen')
+    def test_large_document_is_streamed(self, mock_popen):
+        """Test that a long document is written in chunks and arrives intact."""
+        proc = _mock_lp(mock_popen)
+        content = "é" * 100_000
+
+        Printer.print_document(content)
+
+        assert proc.lp_stdin.write.call_count > 1
+        assert _written(proc) == content.encode("utf-8")
+        proc.lp_stdin.close.assert_called_once()
+        assert proc.communicate.call_args[1]["timeout"] == 10
+
+    @patch('subprocess.Popen')
+    def test_timeout_grows_with_size(self, mock_popen):
+        """Test that a very long document gets extra time beyond the base timeout."""
+        proc = _mock_lp(mock_popen)
+
+        Printer.print_document("x" * (3 * 1024 * 1024))
+
+        assert proc.communicate.call_args[1]["timeout"] == 13
+
+    @patch('subprocess.Popen')
+    def test_timeout_kills_lp(self, mock_popen):
+        """Test that a hung lp process is killed and reported."""
+        proc = _mock_lp(mock_popen)
+        proc.communicate.side_effect = subprocess.TimeoutExpired("lp", 10)
+
+        with pytest.raises(PrinterError, match="timed out"):
+            Printer.print_document("Test content")
+
+        proc.kill.assert_called_once()
+
+    @patch('subprocess.Popen')
+    def test_encoding_error_is_reported(self, mock_popen):
+        """Test that text that cannot be encoded fails the print and still closes lp's input."""
+        proc = _mock_lp(mock_popen)
+
+        with pytest.raises(PrinterError, match="Print error"):
+            Printer.print_document("bad \ud800 text")
+
+        proc.lp_stdin.close.assert_called_once()
+
+    def test_lp_exiting_early_keeps_its_error(self, tmp_path, monkeypatch):
+        """Test that lp's message is reported when it exits without reading a large document."""
+        _fake_lp(tmp_path, monkeypatch, 'echo "lp: Error - No default destination." >&2\nexit 1')
+
+        with pytest.raises(PrinterError, match="Print failed: lp: Error - No default destination."):
+            Printer.print_document("x" * 200_000)
+
+    def test_timeout_covers_writing(self, tmp_path, monkeypatch):
+        """Test that an lp that never reads its input still times out."""
+        _fake_lp(tmp_path, monkeypatch, "exec sleep 30")
+        monkeypatch.setattr("src.kidbank.printer._LP_TIMEOUT", 1)
+
+        with pytest.raises(PrinterError, match="timed out"):
+            Printer.print_document("x" * 300_000)
+
+    @patch('subprocess.Popen')
+    def test_print_receipt(self, mock_popen):
         """Test print receipt wrapper."""
-        mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+        _mock_lp(mock_popen)
 
         account = {
             "first_name": "Test",
@@ -129,24 +275,24 @@ class TestPrinterPrinting:
             "account_number": "111111",
             "account_type": "checking",
             "currency": "USD",
-            "balance": 100.00
+            "balance": 10000
         }
 
         transaction = {
             "transaction_type": "deposit",
-            "amount": 50.00,
-            "new_balance": 100.00,
+            "amount": 5000,
+            "new_balance": 10000,
             "description": "Test"
         }
 
         Printer.print_receipt(account, transaction, 1)
 
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_print_statement(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_print_statement(self, mock_popen):
         """Test print statement wrapper."""
-        mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+        _mock_lp(mock_popen)
 
         account = {
             "first_name": "Test",
@@ -154,11 +300,79 @@ class TestPrinterPrinting:
             "account_number": "111111",
             "account_type": "checking",
             "currency": "USD",
-            "balance": 100.00
+            "balance": 10000
         }
 
         transactions = []
 
         Printer.print_statement(account, transactions)
 
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
+
+
+class TestAsyncPrinting:
+    """Test printing from an event loop."""
+
+    @pytest.fixture
+    def mock_exec(self):
+        """Patched asyncio subprocess launcher whose lp processes succeed."""
+        with patch("src.kidbank.printer.cups", None), \
+                patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            proc = mock_exec.return_value
+            proc.returncode = 0
+            proc.communicate = AsyncMock(return_value=(None, b""))
+            yield mock_exec
+
+    def test_print_many_async(self, mock_exec):
+        """Test that each document gets its own lp job."""
+        asyncio.run(Printer.print_many_async(["first", b"second"]))
+
+        assert mock_exec.call_count == 2
+        assert mock_exec.call_args[0] == ("lp",)
+        sent = [c.args[0] for c in mock_exec.return_value.communicate.call_args_list]
+        assert sent == [b"first", b"second"]
+
+    def test_async_failure(self, mock_exec):
+        """Test that a failing lp job is reported after the batch finishes."""
+        proc = mock_exec.return_value
+        proc.returncode = 1
+        proc.communicate.return_value = (None, b"Printer error")
+
+        with pytest.raises(PrinterError, match="Print failed: Printer error"):
+            asyncio.run(Printer.print_many_async(["first", "second"]))
+
+        assert proc.communicate.call_count == 2
+
+
+class TestCupsPrinting:
+    """Test printing straight to CUPS when pycups is available."""
+
+    @pytest.fixture
+    def mock_cups(self):
+        """Stand-in pycups module with a fresh shared connection."""
+        module = MagicMock()
+        module.Connection.return_value.getDefault.return_value = "Office"
+        with patch("src.kidbank.printer.cups", module), patch.object(Printer, "_cups_conn", None):
+            yield module
+
+    @patch('subprocess.Popen')
+    def test_connection_is_reused(self, mock_popen, mock_cups):
+        """Test that documents go to the default printer over one connection without lp."""
+        Printer.print_document("first")
+        Printer.print_document(b"second")
+
+        conn = mock_cups.Connection.return_value
+        mock_cups.Connection.assert_called_once()
+        mock_popen.assert_not_called()
+        assert conn.createJob.call_args[0][0] == "Office"
+        assert [c.args for c in conn.writeRequestData.call_args_list] == [(b"first", 5), (b"second", 6)]
+        assert conn.finishDocument.call_count == 2
+
+    def test_failure_drops_connection(self, mock_cups):
+        """Test that a CUPS error is reported and the next print reconnects."""
+        mock_cups.Connection.return_value.createJob.side_effect = RuntimeError("server gone")
+
+        with pytest.raises(PrinterError, match="server gone"):
+            Printer.print_document("Test content")
+
+        assert Printer._cups_conn is None